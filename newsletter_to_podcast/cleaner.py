@@ -1,162 +1,460 @@
 from __future__ import annotations
 
+import functools
 import html
 import logging
+import os
 import re
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, List, Pattern, Sequence, Set, Tuple
 
 from bs4 import BeautifulSoup
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except Exception:  # pragma: no cover
+    etree = None  # type: ignore
+    lxml_html = None  # type: ignore
 
 
 logger = logging.getLogger(__name__)
 
 
+# A single character class: the engine tests each code point against one
+# range set instead of trying seven alternatives
 EMOJI_PATTERN = re.compile(
-    "[\U0001F600-\U0001F64F]"  # emoticons
-    "|[\U0001F300-\U0001F5FF]"  # symbols & pictographs
-    "|[\U0001F680-\U0001F6FF]"  # transport & map
-    "|[\U0001F1E0-\U0001F1FF]"  # flags
-    "|[\U00002700-\U000027BF]"  # dingbats
-    "|[\U0001F900-\U0001F9FF]"  # supplemental symbols and pictographs
-    "|[\U00002600-\U000026FF]",  # misc symbols
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002700-\U000027BF"  # dingbats
+    "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
+    "\U00002600-\U000026FF"  # misc symbols
+    "]",
     flags=re.UNICODE,
 )
 
 
+# Photo credit detection (captions not wrapped in <figcaption>)
+_CREDIT_START = re.compile(r"^(photo|photograph|photography|credit|courtesy)\s*:\s*", re.IGNORECASE)
+_CREDIT_AGENCY = re.compile(
+    r"\b(Getty Images|AP(?:\s+Photo)?|Reuters|Bloomberg|AFP|WireImage|USA TODAY)\b", re.IGNORECASE
+)
+_CREDIT_WORD = re.compile(r"\b(photo|photograph|photography|credit|courtesy|via)\b", re.IGNORECASE)
+
+# Tag groups for the DOM passes in clean_html_text
+_MEDIA_TAGS = ["img", "figure", "figcaption", "script", "style", "noscript"]
+_CREDIT_TAGS = frozenset({"p", "div", "span"})
+_AD_TAGS = frozenset({"p", "div", "section"})
+_PARA_TAGS = frozenset({"p", "h1", "h2", "h3", "li", "blockquote"})
+_BLOCK_TAGS = _CREDIT_TAGS | _AD_TAGS | _PARA_TAGS
+
+# Markdown cleanup
+_MD_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MD_IMG = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+_MD_ITALIC = re.compile(r"_(.*?)_")
+_MD_HEAD = re.compile(r"^\s{0,3}#{1,6}\s+")
+_MD_QUOTE = re.compile(r"^\s*>\s?")
+
+# Reader-proxy boilerplate: whole-line removals, fused into one alternation so a
+# paragraph is tested in a single regex pass
+_LINE_KILL = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?:{p})"
+        for p in (
+            r"\s*(?:URL\s*Source|Markdown\s*Content)\b.*",
+            r"\s*!?\s*Image\b.*",
+            r"\s*Illustration\b.*",
+            r"\s*(?:Publish|Published)\s*Time:\s*\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:?\d{2})?.*",
+            r"\s*Title\s*:\s*.*",
+            r"\s*Share this story\.?\s*",
+            r"\s*Thanks to\b.*",
+            r"\s*(?:Photo|Photograph|Photography|Credit|Courtesy)\s*:\s*.*",
+            # Common proxy / anti-bot / captcha warnings
+            r"\s*Warning:\s*Target URL returned error\s*\d+.*",
+            r"\s*Warning:\s*This page.*captcha.*",
+            r"\s*Verify you are human.*",
+            r".*needs to review the security of your connection.*",
+            r"\s*Access denied.*",
+            r"\s*Forbidden\s*",
+        )
+    )
+    + ")$",
+    re.IGNORECASE,
+)
+# Literal heads of the _LINE_KILL alternatives. An ASCII line whose stripped,
+# lowercased text starts with none of these (and lacks the one unanchored
+# phrase) cannot match, so the regex is skipped for ordinary prose
+_LINE_KILL_PREFIXES = (
+    "url",
+    "markdown",
+    "!",
+    "image",
+    "illustration",
+    "publish",
+    "title",
+    "share this story",
+    "thanks to",
+    "photo",
+    "credit",
+    "courtesy",
+    "warning:",
+    "verify you are human",
+    "access denied",
+    "forbidden",
+)
+_LINE_KILL_PHRASE = "needs to review the security of your connection"
+_CREDIT_PREFIXES = ("photo", "credit", "courtesy")
+
+# Reader-proxy boilerplate: inline removals
+_URLSRC_INLINE = re.compile(r"\b(?:URL\s*Source|Markdown\s*Content)\b\s*:?\s*\S+", re.IGNORECASE)
+# Parenthetical photo credits: (Photo: ...), (credit: ...), (via Getty Images)
+_PAREN_CREDIT = re.compile(
+    r"\((?:\s*(?:photo|photograph|photography|credit|courtesy)\b[^)]*|[^)]*\bvia\s+(?:Getty Images|AP(?:\s+Photo)?|Reuters|Bloomberg|AFP)\b[^)]*)\)",
+    re.IGNORECASE,
+)
+# Trailing inline credits starting with Photo:/Credit:/Courtesy:
+_TRAIL_CREDIT = re.compile(
+    r"(?:^|[\.;])\s*(?:Photo|Photograph|Photography|Credit|Courtesy)\s*:\s*[^\n\.]*", re.IGNORECASE
+)
+# Agency credits introduced by 'via ...'
+_VIA_AGENCY = re.compile(
+    r"\bvia\s+(Getty Images|AP(?:\s+Photo)?|Reuters|Bloomberg|AFP|WireImage|USA TODAY)\b[^\n\.]*", re.IGNORECASE
+)
+
+# Per-paragraph normalization
+_WS = re.compile(r"[ \t]+")
+_BRACKET_LETTER = re.compile(r"\[([A-Za-z])\]")
+_BULLET = re.compile(r"^\s*[\-*•]\s+")
+_COLON_SPACE = re.compile(r":(?=\S)")
+# Paragraph separator for the batched passes; the joined variant of the colon
+# rule must not treat the separator as the following character
+_SEP = "\x1e"
+_COLON_SPACE_JOINED = re.compile(r":(?=[^\s\x1e])")
+
+
+@functools.lru_cache(maxsize=32)
+def _ad_matcher(keywords: Tuple[str, ...]) -> Pattern[str]:
+    # One alternation over all (lowercased) keywords: a single scan per block
+    return re.compile("|".join(re.escape(k.lower()) for k in keywords))
+
+
 def strip_emoji(text: str) -> str:
+    # ASCII-only text cannot contain emoji; isascii() is O(1) on CPython
+    if text.isascii():
+        return text
     return EMOJI_PATTERN.sub("", text)
 
 
-def clean_html_text(content_html: str, remove_emoji: bool, remove_ads: bool, ad_keywords: List[str]) -> Tuple[str, str]:
-    soup = BeautifulSoup(content_html or "", "html.parser")
+def _strip_markdown(in_text: str) -> str:
+    # Basic Markdown cleanup so TTS won't read symbols
+    t = in_text
+    # Links: [text](url) -> text
+    t = _MD_LINK.sub(r"\1", t)
+    # Images: ![alt](url) -> alt
+    t = _MD_IMG.sub(r"\1", t)
+    # Emphasis/strong/code markers
+    t = t.replace("**", "").replace("__", "")
+    t = t.replace("`", "")
+    # Single underscore italics: _text_ -> text
+    t = _MD_ITALIC.sub(r"\1", t)
+    # Headings: remove leading # tokens
+    t = _MD_HEAD.sub("", t)
+    # Blockquotes: leading >
+    t = _MD_QUOTE.sub("", t)
+    return t
+
+
+def _strip_noise_tokens(in_text: str) -> str:
+    # Remove boilerplate tokens that come from reader proxies
+    t = in_text
+    # Literal pre-checks are only exact for ASCII; Unicode case folding can match
+    # beyond them, so other text always goes through the regexes
+    ascii_only = t.isascii()
+    low = t.lower()
+    if (
+        not ascii_only or low.lstrip().startswith(_LINE_KILL_PREFIXES) or _LINE_KILL_PHRASE in low
+    ) and _LINE_KILL.match(t):
+        return ""  # drop the line entirely
+
+    # Each substitution only runs when its required literal is present
+    if not ascii_only or "url" in low or "markdown" in low:
+        t = _URLSRC_INLINE.sub("", t)
+    if "(" in t:
+        t = _PAREN_CREDIT.sub("", t)
+    if ":" in t:
+        t = _TRAIL_CREDIT.sub("", t)
+    if not ascii_only or "via" in t.lower():
+        t = _VIA_AGENCY.sub("", t)
+    return t.strip()
+
+
+def _is_credit_text(txt: str) -> bool:
+    # Common photo credits/captions that may not be inside <figcaption>
+    t = txt.strip()
+    if not t:
+        return False
+    # Direct credit line starters
+    if (not t.isascii() or t.lower().startswith(_CREDIT_PREFIXES)) and _CREDIT_START.match(t):
+        return True
+    # Agency mentions frequently used in credits
+    if _CREDIT_AGENCY.search(t):
+        # Only treat as credit if it also mentions photo/credit/courtesy or 'via'
+        if _CREDIT_WORD.search(t):
+            return True
+    return False
+
+
+def _split_paragraphs(text: str) -> List[str]:
+    # Same result as re.split(r"\n{2,}") + strip/filter: the extra "\n" pieces a
+    # plain split leaves inside longer runs are whitespace and get stripped away
+    return [x for x in (s.strip() for s in text.split("\n\n")) if x]
+
+
+def _iter_strings(el, unwrap_links: bool = False) -> Iterator[str]:
+    # Text nodes in document order, skipping comments/PIs (like BeautifulSoup's
+    # get_text). With unwrap_links, each <a> yields its text as one string.
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str):
+            if unwrap_links and child.tag == "a":
+                yield _node_text(child)
+            else:
+                yield from _iter_strings(child, unwrap_links)
+        if child.tail:
+            yield child.tail
+
+
+def _node_text(el, sep: str = " ", unwrap_links: bool = False) -> str:
+    # Equivalent of BeautifulSoup's el.get_text(sep, strip=True)
+    return sep.join(s for s in (t.strip() for t in _iter_strings(el, unwrap_links)) if s)
+
+
+def _drop(el, removed: Set[Any]) -> None:
+    # Detach el (keeping its tail text) and remember its whole subtree as removed
+    removed.update(el.iter())
+    el.drop_tree()
+
+
+def _extract_parts_lxml(content_html: str, remove_ads: bool, ad_keywords: Sequence[str]) -> List[str]:
+    root = lxml_html.document_fromstring(content_html)
+
+    # Remove images/figures/scripts/styles (tails are kept)
+    etree.strip_elements(root, *_MEDIA_TAGS, with_tail=False)
+
+    # One tree walk serves the credit, ad and paragraph passes below; the
+    # tag-filtered iter() walks in C and, unlike an XPath union, needs no sort
+    blocks = list(root.iter(*_BLOCK_TAGS))
+    removed: Set[Any] = set()
+
+    for el in blocks:
+        if el.tag not in _CREDIT_TAGS or el in removed:
+            continue
+        txt = _node_text(el)
+        if txt and _is_credit_text(txt):
+            _drop(el, removed)
+
+    # Drop ad/sponsor paragraphs by keyword
+    if remove_ads and ad_keywords:
+        ad_pat = _ad_matcher(tuple(ad_keywords))
+        for el in blocks:
+            if el.tag not in _AD_TAGS or el in removed:
+                continue
+            if ad_pat.search(_node_text(el).lower()):
+                _drop(el, removed)
+
+    # Normalize into paragraph list while preserving breaks
+    raw_parts: List[str] = []
+    for el in blocks:
+        if el.tag not in _PARA_TAGS or el in removed:
+            continue
+        t = _node_text(el)
+        if t:
+            raw_parts.append(t)
+
+    if not raw_parts:
+        # Fallback: get whole text (links unwrapped) but try to keep some breaks
+        whole = _node_text(root, "\n", unwrap_links=True)
+        raw_parts = _split_paragraphs(whole)
+    return raw_parts
+
+
+def _plaintext_parts(text: str) -> List[str]:
+    # Same paragraphs the parser path yields for tagless, entity-free input,
+    # including libxml2's newline/NUL/BOM normalization
+    text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\x00", "\ufffd")
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    return _split_paragraphs(text)
+
+
+def _extract_parts_bs4(content_html: str, remove_ads: bool, ad_keywords: Sequence[str]) -> List[str]:
+    try:
+        soup = BeautifulSoup(content_html or "", "lxml")
+    except Exception:
+        soup = BeautifulSoup(content_html or "", "html.parser")
 
     # Remove images/figures/scripts/styles
-    for tag in soup.find_all(["img", "figure", "figcaption", "script", "style", "noscript"]):
+    for tag in soup.find_all(_MEDIA_TAGS):
         tag.decompose()
 
-    # Remove common photo credits/captions that may not be inside <figcaption>
-    def _is_credit_text(txt: str) -> bool:
-        t = txt.strip()
-        if not t:
-            return False
-        # Direct credit line starters
-        if re.match(r"^(photo|photograph|photography|credit|courtesy)\s*:\s*", t, flags=re.IGNORECASE):
-            return True
-        # Agency mentions frequently used in credits
-        if re.search(r"\b(Getty Images|AP(?:\s+Photo)?|Reuters|Bloomberg|AFP|WireImage|USA TODAY)\b", t, flags=re.IGNORECASE):
-            # Only treat as credit if it also mentions photo/credit/courtesy or 'via'
-            if re.search(r"\b(photo|photograph|photography|credit|courtesy|via)\b", t, flags=re.IGNORECASE):
-                return True
-        return False
+    # One tree walk serves the credit, ad and paragraph passes below; nodes
+    # removed along the way are marked decomposed and skipped
+    blocks = soup.find_all(sorted(_BLOCK_TAGS))
 
-    for el in soup.find_all(["p", "div", "span"]):
-        try:
-            txt = el.get_text(" ", strip=True)
-        except Exception:
+    for el in blocks:
+        if el.name not in _CREDIT_TAGS or el.decomposed:
             continue
+        txt = el.get_text(" ", strip=True)
         if txt and _is_credit_text(txt):
             el.decompose()
 
     # Drop ad/sponsor paragraphs by keyword
     if remove_ads and ad_keywords:
-        for p in soup.find_all(["p", "div", "section"]):
-            txt = p.get_text(" ", strip=True).lower()
-            if any(k.lower() in txt for k in ad_keywords):
-                p.decompose()
-
-    # Unwrap links, keep text
-    for a in soup.find_all("a"):
-        a.replace_with(a.get_text(" ", strip=True))
+        ad_pat = _ad_matcher(tuple(ad_keywords))
+        for el in blocks:
+            if el.name not in _AD_TAGS or el.decomposed:
+                continue
+            txt = el.get_text(" ", strip=True).lower()
+            if ad_pat.search(txt):
+                el.decompose()
 
     # Normalize into paragraph list while preserving breaks
     raw_parts: List[str] = []
-    for el in soup.find_all(["p", "h1", "h2", "h3", "li", "blockquote"]):
+    for el in blocks:
+        if el.name not in _PARA_TAGS or el.decomposed:
+            continue
         t = el.get_text(" ", strip=True)
         if t:
             raw_parts.append(t)
 
     if not raw_parts:
+        # Unwrap links, keep text (only affects the newline-joined fallback;
+        # space-joined paragraph text is identical either way)
+        for a in soup.find_all("a"):
+            a.replace_with(a.get_text(" ", strip=True))
         # Fallback: get whole text but try to keep some breaks
         whole = soup.get_text("\n", strip=True)
-        raw_parts = [x.strip() for x in re.split(r"\n{2,}", whole) if x.strip()]
-
-    def strip_markdown(in_text: str) -> str:
-        # Basic Markdown cleanup so TTS won't read symbols
-        t = in_text
-        # Links: [text](url) -> text
-        t = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1", t)
-        # Images: ![alt](url) -> alt
-        t = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", r"\1", t)
-        # Emphasis/strong/code markers
-        t = t.replace("**", "").replace("__", "")
-        t = t.replace("`", "")
-        # Single underscore italics: _text_ -> text
-        t = re.sub(r"_(.*?)_", r"\1", t)
-        # Headings: remove leading # tokens
-        t = re.sub(r"^\s{0,3}#{1,6}\s+", "", t)
-        # Blockquotes: leading >
-        t = re.sub(r"^\s*>\s?", "", t)
-        return t
-
-    def strip_noise_tokens(in_text: str) -> str:
-        # Remove boilerplate tokens that come from reader proxies
-        t = in_text
-        # Whole-line removals
-        patterns_line = [
-            r"^\s*(?:URL\s*Source|Markdown\s*Content)\b.*$",
-            r"^\s*!?\s*Image\b.*$",
-            r"^\s*Illustration\b.*$",
-            r"^\s*(?:Publish|Published)\s*Time:\s*\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:?\d{2})?.*$",
-            r"^\s*Title\s*:\s*.*$",
-            r"^\s*Share this story\.?\s*$",
-            r"^\s*Thanks to\b.*$",
-            r"^\s*(?:Photo|Photograph|Photography|Credit|Courtesy)\s*:\s*.*$",
-            # Common proxy / anti-bot / captcha warnings
-            r"^\s*Warning:\s*Target URL returned error\s*\d+.*$",
-            r"^\s*Warning:\s*This page.*captcha.*$",
-            r"^\s*Verify you are human.*$",
-            r"^.*needs to review the security of your connection.*$",
-            r"^\s*Access denied.*$",
-            r"^\s*Forbidden\s*$",
-        ]
-        for pat in patterns_line:
-            if re.match(pat, t, flags=re.IGNORECASE):
-                return ""  # drop the line entirely
-
-        # Inline removals for specific labels
-        t = re.sub(r"\b(?:URL\s*Source|Markdown\s*Content)\b\s*:?\s*\S+", "", t, flags=re.IGNORECASE)
-        # Remove parenthetical photo credits: (Photo: ...), (credit: ...), (via Getty Images)
-        t = re.sub(r"\((?:\s*(?:photo|photograph|photography|credit|courtesy)\b[^)]*|[^)]*\bvia\s+(?:Getty Images|AP(?:\s+Photo)?|Reuters|Bloomberg|AFP)\b[^)]*)\)", "", t, flags=re.IGNORECASE)
-        # Remove trailing inline credits starting with Photo:/Credit:/Courtesy:
-        t = re.sub(r"(?:^|[\.;])\s*(?:Photo|Photograph|Photography|Credit|Courtesy)\s*:\s*[^\n\.]*", "", t, flags=re.IGNORECASE)
-        # Remove agency credits introduced by 'via ...'
-        t = re.sub(r"\bvia\s+(Getty Images|AP(?:\s+Photo)?|Reuters|Bloomberg|AFP|WireImage|USA TODAY)\b[^\n\.]*", "", t, flags=re.IGNORECASE)
-        return t.strip()
+        raw_parts = _split_paragraphs(whole)
+    return raw_parts
 
+
+def _pre_clean(t: str) -> str:
+    # Passes that never look past a paragraph boundary, so they can run on the
+    # separator-joined paragraphs at once
+    t = html.unescape(t)
+    # Substring guards skip the regex VM for the common already-clean paragraph
+    if "  " in t or "\t" in t:
+        t = _WS.sub(" ", t)
+    # Fix single-letter bracketed tokens anywhere: "[R]ecent" -> "Recent", "[T]he" -> "The"
+    if "[" in t:
+        t = _BRACKET_LETTER.sub(r"\1", t)
+    return t
+
+
+def _line_clean(cp: str) -> str:
+    # Anchored or span-matching passes: these must see one paragraph at a time
+    cp = cp.strip()
+    # Drop Markdown markers
+    cp = _strip_markdown(cp)
+    # Drop reader-proxy noise tokens
+    cp = _strip_noise_tokens(cp)
+    # Remove leading bullet symbols
+    return _BULLET.sub("", cp)
+
+
+def _clean_parts(raw_parts: List[str], remove_emoji: bool) -> List[str]:
     # Unescape and clean spaces within each paragraph, keep paragraph boundaries
-    cleaned_parts: List[str] = []
-    for p in raw_parts:
-        cp = html.unescape(p)
-        cp = re.sub(r"[ \t]+", " ", cp).strip()
-        # Fix single-letter bracketed tokens anywhere: "[R]ecent" -> "Recent", "[T]he" -> "The"
-        cp = re.sub(r"\[([A-Za-z])\]", r"\1", cp)
-        # Drop Markdown markers
-        cp = strip_markdown(cp)
-        # Drop reader-proxy noise tokens
-        cp = strip_noise_tokens(cp)
-        # Remove leading bullet symbols
-        cp = re.sub(r"^\s*[\-*•]\s+", "", cp)
-        # Punctuation spacing normalization: ensure space after colon
-        cp = re.sub(r":(?=\S)", ": ", cp)
-        if remove_emoji:
-            cp = strip_emoji(cp)
-        if cp:
-            cleaned_parts.append(cp)
+    if any(_SEP in p for p in raw_parts):
+        # The separator occurs in the text itself; clean paragraph by paragraph
+        out: List[str] = []
+        for p in raw_parts:
+            cp = _COLON_SPACE.sub(": ", _line_clean(_pre_clean(p)))
+            if remove_emoji:
+                cp = strip_emoji(cp)
+            if cp:
+                out.append(cp)
+        return out
+
+    parts = [_line_clean(cp) for cp in _pre_clean(_SEP.join(raw_parts)).split(_SEP)]
+    blob = _SEP.join([cp for cp in parts if cp])
+    # Punctuation spacing normalization: ensure space after colon
+    blob = _COLON_SPACE_JOINED.sub(": ", blob)
+    if remove_emoji:
+        blob = strip_emoji(blob)
+    return [cp for cp in blob.split(_SEP) if cp]
+
+
+def clean_html_text(
+    content_html: str, remove_emoji: bool, remove_ads: bool, ad_keywords: Sequence[str]
+) -> Tuple[str, str]:
+    # Pure w.r.t. its arguments: normalize keywords to a hashable key and memoize
+    kw = tuple(sorted({k.lower() for k in ad_keywords or []}))
+    return _clean_cached(content_html or "", bool(remove_emoji), bool(remove_ads), kw)
+
+
+@functools.lru_cache(maxsize=128)
+def _clean_cached(content_html: str, remove_emoji: bool, remove_ads: bool, ad_keywords: Tuple[str, ...]) -> Tuple[str, str]:
+    raw_parts: List[str] | None = None
+    if "<" not in content_html and "&" not in content_html:
+        # No tags or entities: skip parsing entirely
+        raw_parts = _plaintext_parts(content_html)
+    elif lxml_html is not None:
+        try:
+            raw_parts = _extract_parts_lxml(content_html, remove_ads, ad_keywords)
+        except Exception:
+            # Empty or malformed input (e.g. an encoding declaration in a str); let BS4 handle it
+            raw_parts = None
+    if raw_parts is None:
+        raw_parts = _extract_parts_bs4(content_html, remove_ads, ad_keywords)
 
+    cleaned_parts = _clean_parts(raw_parts, remove_emoji)
     text = "\n\n".join(cleaned_parts)
 
     # Also produce a simple HTML description for RSS (preserve paragraphs)
-    desc_html = "".join(f"<p>{html.escape(p)}</p>" for p in cleaned_parts)
+    # html.escape is a chain of C-level str.replace calls; a list (not a
+    # generator) lets join size the result in one pass
+    esc = html.escape
+    desc_html = "".join([f"<p>{esc(p)}</p>" for p in cleaned_parts])
 
     logger.debug("Cleaned text length", extra={"len": len(text)})
     return text, desc_html
+
+
+# Below this many items a process pool costs more to start than it saves
+_PARALLEL_MIN_ITEMS = 4
+
+
+def _clean_one(args: Tuple[str, bool, bool, Tuple[str, ...]]) -> Tuple[str, str]:
+    return clean_html_text(args[0], remove_emoji=args[1], remove_ads=args[2], ad_keywords=args[3])
+
+
+def clean_html_batch(
+    contents: List[str], remove_emoji: bool, remove_ads: bool, ad_keywords: Sequence[str]
+) -> List[Tuple[str, str]]:
+    """Clean many bodies with the same flags; returns results in input order.
+
+    Cleaning is CPU-bound pure Python, so larger batches are spread across a
+    process pool. Small batches, or hosts where a pool cannot start, run serially.
+    """
+    kw = tuple(ad_keywords or [])
+    # Identical bodies (repeated entries, empty descriptions) are cleaned once
+    bodies = [c or "" for c in contents]
+    unique = list(dict.fromkeys(bodies))
+    args = [(c, remove_emoji, remove_ads, kw) for c in unique]
+    results = None
+    if len(args) >= _PARALLEL_MIN_ITEMS and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(args))) as ex:
+                results = list(ex.map(_clean_one, args, chunksize=4))
+        except Exception as e:  # noqa: BLE001
+            logger.info("Parallel cleaning unavailable; cleaning serially", extra={"error": str(e)})
+    if results is None:
+        results = [_clean_one(a) for a in args]
+    if len(unique) == len(bodies):
+        return results
+    by_body = dict(zip(unique, results))
+    return [by_body[c] for c in bodies]
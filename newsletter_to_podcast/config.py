@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 import os
 import logging
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class SiteConfig:
@@ -26,6 +29,8 @@ class FeedConfig:
     name: str
     url: str
     fetch_original: bool = False
+    # Concurrent article fetches when fetch_original is on
+    fetch_workers: int = 8
 
 
 @dataclass
@@ -52,6 +57,10 @@ class TTSConfig:
     # OpenAI TTS specific
     openai_model: str
     openai_voice: str
+    # Episodes synthesized concurrently in separate mode
+    max_concurrency: int = 4
+    # Chunks of one episode synthesized concurrently
+    max_parallel_chunks: int = 4
 
 
 @dataclass
@@ -59,7 +68,8 @@ class CleanConfig:
     remove_emoji: bool
     strip_html: bool
     remove_ads: bool
-    ad_keywords: List[str]
+    # Lowercased once at load time; the cleaner matches case-insensitively
+    ad_keywords: Tuple[str, ...]
 
 
 @dataclass
@@ -79,6 +89,17 @@ class LLMConfig:
     # Optional external prompt files
     clean_prompt_file: str | None
     rewrite_prompt_file: str | None
+    # Cached LLM responses older than this are requested again
+    cache_ttl_s: float = 7 * 24 * 3600.0
+    # Send rewrites through the (half-price, asynchronous) Batch API; chunks
+    # not back within batch_timeout_s are sent as regular requests
+    batch_mode: bool = False
+    batch_timeout_s: float = 1800.0
+    # Rewrite chunk size, in (estimated) input tokens
+    max_input_tokens: int = 6000
+    # Client-side throttle for rewrite requests (0 disables)
+    max_requests_per_minute: float = 500.0
+    max_tokens_per_minute: float = 30000.0
 
 
 @dataclass
@@ -96,7 +117,7 @@ class AppConfig:
 
 def load_config(path: str = "config.yaml") -> AppConfig:
     with open(path, "r", encoding="utf-8") as f:
-        data: Dict[str, Any] = yaml.safe_load(f)
+        data: Dict[str, Any] = yaml.load(f, Loader=_YamlLoader)
 
     site = data.get("site", {})
     feed = data.get("feed", {})
@@ -121,6 +142,7 @@ def load_config(path: str = "config.yaml") -> AppConfig:
             name=feed.get("name", "Axios"),
             url=feed.get("url", "https://www.axios.com/feeds/feed.rss"),
             fetch_original=bool(feed.get("fetch_original", False)),
+            fetch_workers=int(feed.get("fetch_workers", 8)),
         ),
         output=OutputConfig(
             root_dir=output.get("root_dir", "docs"),
@@ -143,12 +165,14 @@ def load_config(path: str = "config.yaml") -> AppConfig:
             initial_retry_delay=float(tts.get("initial_retry_delay", 2.0)),
             openai_model=tts.get("openai_model", "gpt-4o-mini-tts"),
             openai_voice=tts.get("openai_voice", "alloy"),
+            max_concurrency=int(tts.get("max_concurrency", 4)),
+            max_parallel_chunks=int(tts.get("max_parallel_chunks", 4)),
         ),
         clean=CleanConfig(
             remove_emoji=bool(clean.get("remove_emoji", True)),
             strip_html=bool(clean.get("strip_html", True)),
             remove_ads=bool(clean.get("remove_ads", True)),
-            ad_keywords=list(clean.get("ad_keywords", [])),
+            ad_keywords=tuple(str(k).lower() for k in clean.get("ad_keywords", []) or []),
         ),
         logging=LoggingConfig(level=logging_cfg.get("level", "INFO")),
         llm=LLMConfig(
@@ -160,6 +184,12 @@ def load_config(path: str = "config.yaml") -> AppConfig:
             rewrite_model=llm_cfg.get("rewrite_model", "gpt-4o"),
             clean_prompt_file=llm_cfg.get("clean_prompt_file"),
             rewrite_prompt_file=llm_cfg.get("rewrite_prompt_file"),
+            cache_ttl_s=float(llm_cfg.get("cache_ttl_s", 7 * 24 * 3600.0)),
+            batch_mode=bool(llm_cfg.get("batch_mode", False)),
+            batch_timeout_s=float(llm_cfg.get("batch_timeout_s", 1800.0)),
+            max_input_tokens=int(llm_cfg.get("max_input_tokens", 6000)),
+            max_requests_per_minute=float(llm_cfg.get("max_requests_per_minute", 500.0)),
+            max_tokens_per_minute=float(llm_cfg.get("max_tokens_per_minute", 30000.0)),
         ),
     )
 
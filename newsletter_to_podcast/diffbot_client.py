@@ -2,25 +2,54 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from typing import Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson  # optional: faster decoding of large article payloads
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 
+# Hub/listing-like URL path segments; extend the alternation to add more
+_LISTING_RE = re.compile(r"/(?:newsletters|category|tag)/")
+
+# Shared keep-alive session: the article/list fallback pair hits the same host,
+# so the second call reuses the first call's TCP+TLS connection
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
 def _request_diffbot(api: str, url: str, token: str, timeout: float = 10.0) -> Optional[dict]:
     try:
         ep = f"https://api.diffbot.com/v3/{api}"
         params = {"token": token, "url": url}
-        resp = requests.get(ep, params=params, timeout=timeout)
+        resp = _SESSION.get(ep, params=params, timeout=timeout)
         if resp.status_code != 200:
             logger.info(
                 "Diffbot non-200",
                 extra={"status": resp.status_code, "reason": getattr(resp, "reason", ""), "api": api},
             )
             return None
-        data = resp.json()
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
         if not isinstance(data, dict):
             return None
         return data
@@ -83,7 +112,7 @@ def fetch_via_diffbot(url: str, token_env: str = "DIFFBOT_TOKEN", timeout: float
         return None
 
     url_lc = url.lower()
-    looks_listing = any(s in url_lc for s in ("/newsletters/", "/category/", "/tag/"))
+    looks_listing = bool(_LISTING_RE.search(url_lc))
 
     if looks_listing:
         # 1) list → 2) article
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 import os
 import re
+import threading
 
 import feedparser
 import logging
 import time
-from readability import Document
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import trafilatura
-from newspaper import Article
-import nltk
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 try:
     from .diffbot_client import fetch_via_diffbot  # optional
 except Exception:  # pragma: no cover
@@ -26,7 +30,131 @@ except Exception:  # pragma: no cover
 logger = logging.getLogger(__name__)
 
 
-def fetch_feed(url: str, fetch_original: bool = False) -> List[Dict[str, Any]]:
+# Compiled once at import; these run per line / per anchor in the parsers below
+_MONTHS = "January|February|March|April|May|June|July|August|September|October|November|December"
+# Date like "October 14, 2025" (hub page headings are matched case-insensitively)
+_DATE_PAT = re.compile(rf"\b({_MONTHS})\s+\d{{1,2}},\s+20\d{{2}}\b", re.IGNORECASE)
+_ISSUE_DATE_PAT = re.compile(rf"\b({_MONTHS})\s+\d{{1,2}},\s+20\d{{2}}\b")
+# Numbered section headers "1. Title", "2) Title", "3: Title"
+_NUM_HEADER_PAT = re.compile(r"^(?P<num>[1-5])(?:\.|\)|\:)?\s+(?P<title>.+)$")
+_TRAILING_COLON_PAT = re.compile(r"\s*:\s*$")
+_TAG_STRIP_PAT = re.compile(r"<[^>]+>")
+# Every boundary str.splitlines() breaks on
+_LINE_BREAK_PAT = re.compile(r"[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+# Dated article paths like /2024/10/15/
+_DATED_PATH_PAT = re.compile(r"/(20\d{2})/(\d{2})/(\d{2})/")
+_AXIOS_URL_PAT = re.compile(r"https?://(?:www\.)?axios\.com/20\d{2}/\d{2}/\d{2}/[\w\-/%]+")
+# Either /yyyy/mm/dd or /yyyy-mm-dd after the newsletter path
+_ISSUE_URL_PAT = re.compile(r"/newsletters/axios-ai-plus/(20\d{2})[-/](\d{2})[-/](\d{2})(?:/|$)")
+_ISSUE_ABS_URL_PAT = re.compile(
+    r"https?://(?:www\.)?axios\.com/newsletters/axios-ai-plus/(20\d{2})[-/](\d{2})[-/](\d{2})(?:/|$)"
+)
+# Both plaintext URL kinds in one alternation, sharing the scheme/host prefix
+_PLAIN_URL_PAT = re.compile(
+    r"https?://(?:www\.)?axios\.com/(?:(?P<dated>20\d{2}/\d{2}/\d{2}/[\w\-/%]+)"
+    r"|newsletters/axios-ai-plus/(?P<y>20\d{2})[-/](?P<mo>\d{2})[-/](?P<d>\d{2})(?:/|$))"
+)
+
+
+# Below this many pages a process pool costs more to start than it saves
+_PARALLEL_EXTRACT_MIN_PAGES = 4
+
+
+def _extract_one(args: Tuple[Optional[str], str]) -> Tuple[Optional[str], Optional[str]]:
+    # Extract one downloaded article page; (None, None) when nothing usable
+    page_html, link = args
+    if not page_html:
+        return None, None
+    return extract_main_html(page_html, base_url=link)
+
+
+def _extract_pages(pages: List[Optional[str]], links: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+    # Extraction is CPU-bound (lxml + trafilatura heuristics), so several
+    # pages go to a process pool; results keep input order
+    args = list(zip(pages, links))
+    todo = sum(1 for p in pages if p)
+    if todo >= _PARALLEL_EXTRACT_MIN_PAGES and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, todo)) as ex:
+                return list(ex.map(_extract_one, args))
+        except Exception as e:  # noqa: BLE001
+            logger.info("Parallel extraction unavailable; extracting serially", extra={"error": str(e)})
+    return [_extract_one(a) for a in args]
+
+
+def _is_plaintext(page_html: str) -> bool:
+    # Reader-proxy output has no markup up front; find() avoids slicing a copy
+    return bool(page_html) and page_html.find("<", 0, 1000) == -1
+
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+def _parse_html(page_html: str) -> Optional[Any]:
+    # lxml tree for the meta/anchor/heading queries; None for an empty document
+    try:
+        return lxml_html.document_fromstring(page_html)
+    except Exception:
+        pass
+    try:
+        # str input carrying an XML encoding declaration must be fed as bytes
+        return lxml_html.document_fromstring(page_html.encode("utf-8"))
+    except Exception:
+        return None
+
+
+def _iter_text(el) -> Iterator[str]:
+    # Text nodes in document order, skipping comments and script/style content
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _iter_text(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(el, sep: str = "", strip: bool = False) -> str:
+    # Equivalent of BeautifulSoup's el.get_text(sep, strip=strip)
+    if strip:
+        return sep.join(s for s in (t.strip() for t in _iter_text(el)) if s)
+    return sep.join(_iter_text(el))
+
+
+def _bounded_text(el, limit: int) -> str:
+    # _text(el, " ", strip=True)[:limit] without joining the whole document
+    out: List[str] = []
+    n = 0
+    for t in _iter_text(el):
+        t = t.strip()
+        if t:
+            out.append(t)
+            n += len(t) + 1
+            if n > limit:
+                break
+    return " ".join(out)[:limit]
+
+
+def _first(root, path: str) -> Optional[Any]:
+    # First element matching an XPath, like BeautifulSoup's find()
+    if root is None:
+        return None
+    found = root.xpath(path)
+    return found[0] if found else None
+
+
+def _only_string(el) -> Optional[str]:
+    # Equivalent of BeautifulSoup's Tag.string: the sole text child, if any
+    if len(el) == 0:
+        return el.text or None
+    if el.text or len(el) != 1 or el[0].tail:
+        return None
+    child = el[0]
+    return _only_string(child) if isinstance(child.tag, str) else child.text
+
+
+def fetch_feed(url: str, fetch_original: bool = False, max_workers: int = 8) -> List[Dict[str, Any]]:
     # If configured URL is the Axios AI Plus newsletter page, scrape it directly
     try:
         parsed_url = urlparse(url)
@@ -41,42 +169,94 @@ def fetch_feed(url: str, fetch_original: bool = False) -> List[Dict[str, Any]]:
         # Fallback to RSS flow if URL parsing fails
         pass
 
-    parsed = feedparser.parse(url)
-    if parsed.bozo:
-        logger.warning("Feed parse warning", extra={"detail": str(parsed.bozo_exception)})
+    # Conditional poll: an unchanged feed answers 304 and the previous items
+    # stand in for its entries. The cache is only valid for the same URL and
+    # fetch_original setting
+    feed_cache_path = _page_cache_path(url, prefix="feed-")
+    cached = _cache_read(feed_cache_path) or {}
+    if (
+        cached.get("url") != url
+        or cached.get("fetch_original") != fetch_original
+        or not isinstance(cached.get("items"), list)
+    ):
+        cached = {}
+    parsed = feedparser.parse(url, etag=cached.get("etag"), modified=cached.get("modified"))
+    status = getattr(parsed, "status", None)
     items: List[Dict[str, Any]] = []
-    for e in parsed.entries:
-        guid = getattr(e, "id", None) or getattr(e, "guid", None) or getattr(e, "link", "")
-        link = getattr(e, "link", "")
-        title = getattr(e, "title", "(no title)")
-        author = getattr(e, "author", "")
-        published = getattr(e, "published", "") or getattr(e, "updated", "")
-        summary = getattr(e, "summary", "")
-        content = summary
-        if getattr(e, "content", None):
-            try:
-                content = e.content[0].value or content  # type: ignore[attr-defined]
-            except Exception:
-                pass
-        item: Dict[str, Any] = {
-            "guid": guid,
-            "link": link,
-            "title": title,
-            "author": author,
-            "published": published,
-            "content_html": content,
-            "content_source": "rss",
+    if status == 304 and cached:
+        logger.info("Feed not modified; reusing cached entries", extra={"count": len(cached["items"])})
+        items = [dict(it) for it in cached["items"]]
+    else:
+        if parsed.bozo:
+            logger.warning("Feed parse warning", extra={"detail": str(parsed.bozo_exception)})
+        for e in parsed.entries:
+            guid = getattr(e, "id", None) or getattr(e, "guid", None) or getattr(e, "link", "")
+            link = getattr(e, "link", "")
+            title = getattr(e, "title", "(no title)")
+            author = getattr(e, "author", "")
+            published = getattr(e, "published", "") or getattr(e, "updated", "")
+            summary = getattr(e, "summary", "")
+            content = summary
+            if getattr(e, "content", None):
+                try:
+                    content = e.content[0].value or content  # type: ignore[attr-defined]
+                except Exception:
+                    pass
+            item: Dict[str, Any] = {
+                "guid": guid,
+                "link": link,
+                "title": title,
+                "author": author,
+                "published": published,
+                "content_html": content,
+                "content_source": "rss",
+            }
+            items.append(item)
+
+    if fetch_original:
+        # Entries enriched on an earlier run keep that article text
+        seen = {
+            (it.get("guid"), it.get("link")): it
+            for it in cached.get("items", [])
+            if it.get("content_source") != "rss"
         }
-
-        if fetch_original and link:
-            page_html = fetch_article_page(link)
-            if page_html:
-                extracted, source = extract_main_html(page_html, base_url=link)
-                if extracted:
-                    item["content_html"] = extracted
-                    item["content_source"] = source or "original"
-
-        items.append(item)
+        for item in items:
+            prev = seen.get((item["guid"], item["link"]))
+            if prev is not None:
+                item["content_html"] = prev.get("content_html", item["content_html"])
+                item["content_source"] = prev.get("content_source", "original")
+
+        # Article fetches are network-bound; overlap them (results keep feed order).
+        # Entries still at "rss" (including failures from a previous run) are retried
+        targets = [it for it in items if it["link"] and it["content_source"] == "rss"]
+        links = [it["link"] for it in targets]
+        if max_workers > 1 and len(links) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(links))) as ex:
+                pages = list(ex.map(fetch_article_page, links))
+        else:
+            pages = [fetch_article_page(link) for link in links]
+        results = _extract_pages(pages, links)
+        for item, (extracted, source) in zip(targets, results):
+            if extracted:
+                item["content_html"] = extracted
+                item["content_source"] = source or "original"
+
+    # Network errors come back as an empty bozo result without a status; only
+    # a real answer may replace the stored entries and validators
+    if status in (200, 304):
+        # A 304 need not repeat the validators; keep the ones it answered
+        prev = cached if status == 304 else {}
+        _cache_write(
+            feed_cache_path,
+            {
+                "url": url,
+                "etag": parsed.get("etag") or prev.get("etag"),
+                "modified": parsed.get("modified") or prev.get("modified"),
+                "fetch_original": fetch_original,
+                "items": items,
+                "fetched_at": time.time(),
+            },
+        )
     logger.info("Fetched feed entries", extra={"count": len(items)})
     return items
 
@@ -93,7 +273,7 @@ def fetch_from_listing(list_url: str, max_items: int = 20) -> List[Dict[str, Any
         return []
 
     # If the listing page is plaintext (via reader), try to parse it as a single issue directly
-    if page_html and "<" not in page_html[:1000]:
+    if _is_plaintext(page_html):
         issue = extract_issue_from_listing_plaintext(page_html)
         if issue:
             title, author, published, html_body = issue
@@ -111,26 +291,20 @@ def fetch_from_listing(list_url: str, max_items: int = 20) -> List[Dict[str, Any
             ]
 
     # HTML path: extract date and compose content from the hub page itself
-    try:
-        soup = BeautifulSoup(page_html, "lxml")
-    except Exception:
-        soup = BeautifulSoup(page_html, "html.parser")
+    root = _parse_html(page_html)
 
     published = None
-    date_pat = re.compile(
-        r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+20\d{2}\b",
-        re.IGNORECASE,
-    )
-    for h in soup.find_all(["h1", "h2", "h3"], limit=8):
-        txt = h.get_text(" ", strip=True)
-        m = date_pat.search(txt)
-        if m:
-            published = m.group(0)
-            break
-    if not published:
-        m = date_pat.search(soup.get_text(" ", strip=True)[:2000])
-        if m:
-            published = m.group(0)
+    if root is not None:
+        for h in islice(root.iter("h1", "h2", "h3"), 8):
+            txt = _text(h, " ", strip=True)
+            m = _DATE_PAT.search(txt)
+            if m:
+                published = m.group(0)
+                break
+        if not published:
+            m = _DATE_PAT.search(_bounded_text(root, 2000))
+            if m:
+                published = m.group(0)
 
     # Use the listing page itself as the content source
     content_html, source = extract_main_html(page_html, base_url=list_url)
@@ -151,6 +325,22 @@ def fetch_from_listing(list_url: str, max_items: int = 20) -> List[Dict[str, Any
     return [item]
 
 
+def _wrap_paras(paras: List[str]) -> str:
+    # <p>-wrapped paragraphs as one join over the list (no per-item f-strings)
+    return "<p>" + "</p><p>".join(paras) + "</p>" if paras else ""
+
+
+def _paras_to_html(block: str) -> str:
+    # Blank-line separated paragraphs -> <p> elements. Blocks are joined from
+    # rstripped lines, so blank lines are empty and a plain split on "\n\n"
+    # (pieces stripped) matches splitting on r"\n\s*\n+". Reader output is
+    # normally tag-free, so the tag scrub only runs when there is a "<" at all
+    paras = [p for p in (x.strip() for x in block.split("\n\n")) if p]
+    if "<" in block:
+        paras = [_TAG_STRIP_PAT.sub("", p) for p in paras]
+    return _wrap_paras(paras)
+
+
 def extract_issue_from_listing_plaintext(text: str) -> Optional[Tuple[str, str, str, str]]:
     """Parse a newsletter listing plaintext into a single-issue HTML body.
 
@@ -159,23 +349,20 @@ def extract_issue_from_listing_plaintext(text: str) -> Optional[Tuple[str, str,
     """
     lines = [ln.rstrip() for ln in text.splitlines()]
     # Date like "October 14, 2025" — search entire text to be robust
-    m_date = re.search(
-        r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+20\d{2}\b",
-        text,
-    )
+    m_date = _ISSUE_DATE_PAT.search(text)
     published = m_date.group(0) if m_date else None
 
     # Find numbered headings starting with 1..5
     starts: List[Tuple[int, int, str]] = []  # (idx, num, title)
     for idx, ln in enumerate(lines):
-        m = re.match(r"^(?P<num>[1-5])(?:\.|\)|\:)?\s+(?P<title>.+)$", ln.strip())
+        m = _NUM_HEADER_PAT.match(ln.strip())
         if m:
             num = int(m.group("num"))
             title = m.group("title").strip()
             # Strip basic Markdown markers from title to avoid TTS reading them
             title = title.replace("**", "").replace("__", "").replace("`", "")
             # Normalize special case like "1 big thing: ..."
-            title = re.sub(r"\s*:\s*$", "", title)
+            title = _TRAILING_COLON_PAT.sub("", title)
             starts.append((idx, num, title))
     # Need at least items 1..4
     have_nums = {n for (_, n, _) in starts}
@@ -198,9 +385,7 @@ def extract_issue_from_listing_plaintext(text: str) -> Optional[Tuple[str, str,
     first_start = ordered[0][0]
     if first_start > 0:
         intro_block = "\n".join(lines[:first_start]).strip()
-        intro_paras = [p.strip() for p in re.split(r"\n\s*\n+", intro_block) if p.strip()]
-        if intro_paras:
-            intro_html = "".join(f"<p>{re.sub(r'<[^>]+>', '', p)}</p>" for p in intro_paras)
+        intro_html = _paras_to_html(intro_block)
 
     # Build sections until next header
     html_parts: List[str] = []
@@ -217,8 +402,7 @@ def extract_issue_from_listing_plaintext(text: str) -> Optional[Tuple[str, str,
         body = "\n".join(body_lines).strip()
 
         # Use the newsletter's own prose from the listing text; do not replace with linked articles
-        paras = [p.strip() for p in re.split(r"\n\s*\n+", body) if p.strip()]
-        html_body = "".join(f"<p>{re.sub(r'<[^>]+>', '', p)}</p>" for p in paras) if paras else ""
+        html_body = _paras_to_html(body)
         html_parts.append(f"<h3>{num}. {title}</h3>" + html_body)
 
     issue_title = None
@@ -230,6 +414,55 @@ def extract_issue_from_listing_plaintext(text: str) -> Optional[Tuple[str, str,
     return issue_title, author, published or "", "".join(html_parts)
 
 
+@functools.lru_cache(maxsize=4)
+def _scan_plaintext_urls(text: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """Dated article URLs and (issue URL, yyyymmdd) pairs from reader plaintext.
+
+    One pass serves both link extractors on the same page.
+    """
+    dated: List[str] = []
+    issues: List[Tuple[str, str]] = []
+    for m in _PLAIN_URL_PAT.finditer(text):
+        url = m.group(0)
+        if m.group("dated") is None:
+            issues.append((url, f"{m.group('y')}{m.group('mo')}{m.group('d')}"))
+        elif "http" in url[1:]:
+            # An article slug ran into another URL; separate scans see both
+            break
+        else:
+            dated.append(url)
+    else:
+        return tuple(dated), tuple(issues)
+    return (
+        tuple(m.group(0) for m in _AXIOS_URL_PAT.finditer(text)),
+        tuple((m.group(0), f"{m.group(1)}{m.group(2)}{m.group(3)}") for m in _ISSUE_ABS_URL_PAT.finditer(text)),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _anchor_hrefs(page_html: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    # Stripped, non-empty hrefs of the whole page and of its <main> (the page
+    # again when there is none). Both link extractors read the same hub page,
+    # so it is parsed and walked once
+    root = _parse_html(page_html)
+    if root is None:
+        return (), ()
+
+    def _hrefs(el) -> Tuple[str, ...]:
+        out = []
+        for a in el.iter("a"):
+            href = a.get("href")
+            if href is not None:
+                href = href.strip()
+                if href:
+                    out.append(href)
+        return tuple(out)
+
+    all_hrefs = _hrefs(root)
+    main = next(root.iter("main"), None)
+    return all_hrefs, (_hrefs(main) if main is not None else all_hrefs)
+
+
 def extract_article_links_from_html(page_html: str, base_url: Optional[str] = None) -> List[str]:
     """Extract likely article links from a listing/issue page.
 
@@ -238,19 +471,17 @@ def extract_article_links_from_html(page_html: str, base_url: Optional[str] = No
     - Only keep links on axios.com domain
     - De-duplicate and keep readable URLs (no fragments)
     """
-    try:
-        soup = BeautifulSoup(page_html, "lxml")
-    except Exception:
-        soup = BeautifulSoup(page_html, "html.parser")
-
     # Collect all anchor hrefs in main content area if available
-    container = soup.find("main") or soup
+    base = base_url or ""
     hrefs: List[str] = []
-    for a in container.find_all("a", href=True):
-        href = a["href"].strip()
-        if not href or href.startswith("#"):
+    for href in _anchor_hrefs(page_html)[1]:
+        if href.startswith("#"):
+            continue
+        abs_url = urljoin(base, href)
+        # netloc and path are substrings of the URL: when either test below
+        # cannot pass on the whole string, skip the urlparse
+        if "axios.com" not in abs_url or not _DATED_PATH_PAT.search(abs_url):
             continue
-        abs_url = urljoin(base_url or "", href)
         try:
             pu = urlparse(abs_url)
         except Exception:
@@ -258,16 +489,22 @@ def extract_article_links_from_html(page_html: str, base_url: Optional[str] = No
         if not pu.netloc.endswith("axios.com"):
             continue
         # Heuristic: match dated articles like /2024/10/15/... or /2025/...
-        if re.search(r"/20\d{2}/\d{2}/\d{2}/", pu.path):
+        if _DATED_PATH_PAT.search(pu.path):
             hrefs.append(abs_url)
 
     # Fallback: if nothing matched, consider article-card anchors with data-testid
-    if not hrefs:
-        for a in container.select("a[data-testid*='card'], a[aria-label], a[rel='bookmark']"):
+    root = _parse_html(page_html) if not hrefs else None
+    if root is not None:
+        container = next(root.iter("main"), root)
+        for a in container.xpath(
+            ".//a[contains(@data-testid, 'card') or @aria-label or normalize-space(@rel) = 'bookmark']"
+        ):
             href = a.get("href")
             if not href:
                 continue
-            abs_url = urljoin(base_url or "", href)
+            abs_url = urljoin(base, href)
+            if "axios.com" not in abs_url:
+                continue
             try:
                 pu = urlparse(abs_url)
             except Exception:
@@ -276,9 +513,8 @@ def extract_article_links_from_html(page_html: str, base_url: Optional[str] = No
                 hrefs.append(abs_url)
 
     # If still empty, try regex over plaintext for dated Axios URLs
-    if not hrefs and page_html and "<" not in page_html[:1000]:
-        for m in re.finditer(r"https?://(?:www\.)?axios\.com/20\d{2}/\d{2}/\d{2}/[\w\-/%]+", page_html):
-            hrefs.append(m.group(0))
+    if not hrefs and _is_plaintext(page_html):
+        hrefs.extend(_scan_plaintext_urls(page_html)[0])
 
     # Deduplicate while preserving order
     seen: set[str] = set()
@@ -293,18 +529,10 @@ def extract_article_links_from_html(page_html: str, base_url: Optional[str] = No
 def extract_latest_issue_link(page_html: str, base_url: Optional[str] = None) -> Optional[str]:
     """Find the latest Axios AI Plus issue URL from hub page (HTML or plaintext)."""
     candidates: List[Tuple[str, str]] = []  # (url, yyyymmdd)
-    # Regex that matches either /yyyy/mm/dd or /yyyy-mm-dd after the newsletter path
-    pat = re.compile(r"/newsletters/axios-ai-plus/(20\d{2})[-/](\d{2})[-/](\d{2})(?:/|$)")
+    pat = _ISSUE_URL_PAT
 
     # Try HTML
-    try:
-        soup = BeautifulSoup(page_html, "lxml")
-    except Exception:
-        soup = BeautifulSoup(page_html, "html.parser")
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if not href:
-            continue
+    for href in _anchor_hrefs(page_html)[0]:
         abs_url = urljoin(base_url or "", href)
         m = pat.search(abs_url)
         if m:
@@ -312,11 +540,8 @@ def extract_latest_issue_link(page_html: str, base_url: Optional[str] = None) ->
             candidates.append((abs_url, f"{y}{mo}{d}"))
 
     # Plaintext fallback
-    if not candidates and page_html and "<" not in page_html[:1000]:
-        for m in re.finditer(r"https?://(?:www\.)?axios\.com/newsletters/axios-ai-plus/(20\d{2})[-/](\d{2})[-/](\d{2})(?:/|$)", page_html):
-            abs_url = m.group(0)
-            y, mo, d = m.group(1), m.group(2), m.group(3)
-            candidates.append((abs_url, f"{y}{mo}{d}"))
+    if not candidates and _is_plaintext(page_html):
+        candidates.extend(_scan_plaintext_urls(page_html)[1])
 
     if not candidates:
         return None
@@ -327,51 +552,210 @@ def extract_latest_issue_link(page_html: str, base_url: Optional[str] = None) ->
 
 def extract_title_author_date(page_html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Extract title, author, and published date from an article page's HTML."""
-    try:
-        soup = BeautifulSoup(page_html, "lxml")
-    except Exception:
-        soup = BeautifulSoup(page_html, "html.parser")
+    root = _parse_html(page_html)
 
     # Title
     title = None
-    ogt = soup.find("meta", attrs={"property": "og:title"})
-    if ogt and ogt.get("content"):
-        title = ogt["content"].strip()
-    if not title and soup.title and soup.title.string:
-        title = soup.title.string.strip()
-    if not title and page_html and "<" not in page_html[:1000]:
-        for ln in page_html.splitlines():
-            ln = ln.strip()
-            if ln:
-                title = ln[:200]
-                break
+    ogt = _first(root, "//meta[@property='og:title']")
+    if ogt is not None and ogt.get("content"):
+        title = ogt.get("content").strip()
+    title_el = _first(root, "//title")
+    if not title and title_el is not None and _only_string(title_el):
+        title = _only_string(title_el).strip()
+    if not title and _is_plaintext(page_html):
+        # First non-blank line. Line breaks are whitespace to strip(), so it
+        # starts at the first non-space character; no need to split the page
+        body = page_html.lstrip()
+        if body:
+            m = _LINE_BREAK_PAT.search(body)
+            title = (body[: m.start()] if m else body).strip()[:200]
 
     # Author
     author = None
-    meta_author = soup.find("meta", attrs={"name": "author"})
-    if meta_author and meta_author.get("content"):
-        author = meta_author["content"].strip()
+    meta_author = _first(root, "//meta[@name='author']")
+    if meta_author is not None and meta_author.get("content"):
+        author = meta_author.get("content").strip()
     # Published time
     published = None
-    pub_meta = soup.find("meta", attrs={"property": "article:published_time"})
-    if pub_meta and pub_meta.get("content"):
-        published = pub_meta["content"].strip()
+    pub_meta = _first(root, "//meta[@property='article:published_time']")
+    if pub_meta is not None and pub_meta.get("content"):
+        published = pub_meta.get("content").strip()
     if not published:
-        t = soup.find("time")
-        if t and (t.get("datetime") or t.get_text(strip=True)):
-            published = (t.get("datetime") or t.get_text(strip=True)).strip()
+        t = _first(root, "//time")
+        if t is not None and (t.get("datetime") or _text(t, strip=True)):
+            published = (t.get("datetime") or _text(t, strip=True)).strip()
 
     return title, author, published
 
 
 def parse_date_from_url(href: str) -> Optional[str]:
-    m = re.search(r"/(20\d{2})/(\d{2})/(\d{2})/", href)
+    # Every match starts with "/20"; most URLs are rejected by this C-level scan
+    if "/20" not in href:
+        return None
+    m = _DATED_PATH_PAT.search(href)
     if not m:
         return None
     y, mo, d = m.group(1), m.group(2), m.group(3)
     return f"{y}-{mo}-{d}"
 
 
+_BROWSER_UA = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Safari/537.36"
+)
+_PAGE_HEADERS = {
+    "User-Agent": _BROWSER_UA,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "DNT": "1",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+}
+_JINA_HEADERS = {"User-Agent": _BROWSER_UA, "Accept": "text/plain,*/*;q=0.8"}
+
+
+def _make_session(retry: Retry) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _page_session(max_retries: int) -> requests.Session:
+    # One keep-alive session per retry budget: repeated fetches from the same
+    # host (hub page, articles) reuse pooled TCP+TLS connections
+    return _make_session(
+        Retry(
+            total=max_retries,
+            backoff_factor=1.0,
+            status_forcelist=[403, 404, 408, 429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+            raise_on_status=False,
+        )
+    )
+
+
+# r.jina.ai fallback: a single quick retry
+_JINA_SESSION = _make_session(Retry(total=1, backoff_factor=0))
+
+
+# Conditional-request page cache: body plus validators per URL. Reruns send
+# If-None-Match / If-Modified-Since and reuse the stored body on a 304
+PAGE_CACHE_DIR = os.path.join("data", "http_cache")
+# Entries fetched longer ago than this are deleted by prune_page_cache(); a
+# pruned URL is simply downloaded in full again
+PAGE_CACHE_MAX_AGE_S = 14 * 24 * 3600
+
+
+def _page_cache_path(url: str, prefix: str = "") -> str:
+    return os.path.join(PAGE_CACHE_DIR, prefix + hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _cache_read(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        return entry if isinstance(entry, dict) else None
+    except Exception:
+        return None
+
+
+def _cache_write(path: str, entry: Dict[str, Any]) -> None:
+    # Temp file + os.replace: concurrent fetches never observe a partial entry
+    try:
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("HTTP cache write failed", extra={"path": path, "error": str(e)})
+
+
+def prune_page_cache(max_age_s: float = PAGE_CACHE_MAX_AGE_S) -> None:
+    """Delete page/feed cache entries older than max_age_s (by fetched_at)."""
+    cutoff = time.time() - max_age_s
+    removed = 0
+    try:
+        with os.scandir(PAGE_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                cached = _cache_read(entry.path) or {}
+                try:
+                    fetched_at = float(cached.get("fetched_at") or entry.stat().st_mtime)
+                    if fetched_at < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except (OSError, TypeError, ValueError):
+                    pass
+    except OSError:
+        return
+    if removed:
+        logger.info("Pruned HTTP cache", extra={"removed": removed})
+
+
+def _page_cache_load(url: str) -> Optional[Dict[str, Any]]:
+    entry = _cache_read(_page_cache_path(url))
+    if entry and entry.get("url") == url and entry.get("body"):
+        return entry
+    return None
+
+
+def _page_cache_store(url: str, resp: requests.Response, body: str) -> None:
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return  # nothing to revalidate with
+    _cache_write(
+        _page_cache_path(url),
+        {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            "fetched_at": time.time(),
+        },
+    )
+
+
+def _cached_get(
+    session: requests.Session, url: str, headers: Dict[str, str], timeout: float
+) -> Tuple[Optional[str], requests.Response]:
+    """GET with ETag/Last-Modified revalidation against the on-disk page cache.
+
+    Returns (body, response); body is None unless the response was a 200 with
+    content or a 304 answered from the cache.
+    """
+    entry = _page_cache_load(url)
+    if entry:
+        headers = dict(headers)
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    resp = session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    if resp.status_code == 304 and entry:
+        logger.debug("Page not modified; using cached copy", extra={"url": url})
+        return entry["body"], resp
+    if resp.status_code == 200:
+        # Response.text re-decodes the whole body (and may re-run charset
+        # detection) on every access; decode once and hand the str around
+        body = resp.text
+        if body:
+            _page_cache_store(url, resp, body)
+            return body, resp
+    return None, resp
+
+
 def fetch_article_page(url: str, max_retries: int = 3, timeout: float = 10.0) -> Optional[str]:
     # Support local file input (useful under restricted network)
     try:
@@ -386,41 +770,13 @@ def fetch_article_page(url: str, max_retries: int = 3, timeout: float = 10.0) ->
                 return f.read()
     except Exception:
         pass
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-        "DNT": "1",
-        "Referer": url,
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-    }
-
-    session = requests.Session()
-    retry = Retry(
-        total=max_retries,
-        backoff_factor=1.0,
-        status_forcelist=[403, 404, 408, 429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"],
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    headers = {**_PAGE_HEADERS, "Referer": url}
+    session = _page_session(max_retries)
 
     try:
-        resp = session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-        if resp.status_code == 200 and resp.text:
-            return resp.text
+        body, resp = _cached_get(session, url, headers, timeout)
+        if body:
+            return body
         logger.warning(
             f"Article fetch non-200 ({resp.status_code})",
             extra={"url": url, "status": resp.status_code, "reason": getattr(resp, "reason", "")},
@@ -460,27 +816,15 @@ def fetch_article_page(url: str, max_retries: int = 3, timeout: float = 10.0) ->
 
 def fetch_via_jina(url: str, timeout: float = 10.0) -> Optional[str]:
     try:
-        session = requests.Session()
-        adapter = HTTPAdapter(max_retries=Retry(total=1, backoff_factor=0))
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/124.0.0.0 Safari/537.36"
-            ),
-            "Accept": "text/plain,*/*;q=0.8",
-        }
         pu = urlparse(url)
         # Try both http and https targets
         for scheme in ("https", "http"):
             proxied = f"https://r.jina.ai/{scheme}://{pu.netloc}{pu.path}"
             if pu.query:
                 proxied += f"?{pu.query}"
-            resp = session.get(proxied, headers=headers, timeout=timeout)
-            if resp.status_code == 200 and resp.text:
-                return resp.text
+            body, _ = _cached_get(_JINA_SESSION, proxied, _JINA_HEADERS, timeout)
+            if body:
+                return body
     except Exception:
         pass
     return None
@@ -515,66 +859,61 @@ def _web_text_looks_useful(text: str) -> bool:
         return False
 
 
-def extract_main_html(page_html: str, base_url: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
-    # Plaintext input (e.g., from r.jina.ai) → wrap into paragraphs
-    if page_html and "<" not in page_html[:1000]:
-        lines = [ln.strip() for ln in page_html.splitlines()]
-        paras: List[str] = []
-        buf: List[str] = []
-        for ln in lines:
-            if ln:
-                buf.append(ln)
-            elif buf:
-                paras.append(" ".join(buf))
-                buf = []
-        if buf:
-            paras.append(" ".join(buf))
-        if paras:
-            html_out = "".join(f"<p>{p}</p>" for p in paras)
-            return html_out, "plaintext"
-    # 1) Trafilatura (prefer fulltext extraction)
-    try:
-        txt = trafilatura.extract(
-            page_html,
-            url=base_url,
-            include_comments=False,
-            include_tables=False,
-            favor_precision=True,
-        )
-        if txt and len(txt) > 200:
-            paras = [p.strip() for p in txt.split("\n") if p.strip()]
-            html_out = "".join(f"<p>{p}</p>" for p in paras)
-            return html_out, "trafilatura"
-    except Exception:
-        pass
+@functools.lru_cache(maxsize=1)
+def _ensure_punkt() -> None:
+    # newspaper3k needs the punkt tokenizer; check (and fetch) once per process
+    import nltk
 
-    # 2) Readability as secondary
     try:
-        doc = Document(page_html)
-        summary = doc.summary(html_partial=True)
-        if summary and len(BeautifulSoup(summary, "html.parser").get_text(" ", strip=True)) > 200:
-            return summary, "readability"
+        nltk.data.find("tokenizers/punkt")
     except Exception:
-        pass
+        nltk.download("punkt", quiet=True)
+
+
+def _extract_trafilatura(page_html: str, base_url: Optional[str]) -> Optional[str]:
+    # Prefer fulltext extraction
+    txt = trafilatura.extract(
+        page_html,
+        url=base_url,
+        include_comments=False,
+        include_tables=False,
+        favor_precision=True,
+    )
+    if txt and len(txt) > 200:
+        return _wrap_paras([p for p in (x.strip() for x in txt.split("\n")) if p])
+    return None
+
+
+def _extract_readability(page_html: str, base_url: Optional[str]) -> Optional[str]:
+    # Deferred imports: readability and newspaper3k (which drags in nltk) cost
+    # a few hundred ms to load and are only reached when trafilatura falls short
+    from readability import Document
+
+    doc = Document(page_html)
+    summary = doc.summary(html_partial=True)
+    # Visible text is never longer than the markup, so short summaries fail
+    # without a parse; otherwise measure the text with lxml (no BS4 pass)
+    if not summary or len(summary) <= 200:
+        return None
+    root = _parse_html(summary)
+    if root is not None and len(_text(root, " ", strip=True)) > 200:
+        return summary
+    return None
+
+
+def _extract_newspaper(page_html: str, base_url: Optional[str]) -> Optional[str]:
+    from newspaper import Article
+
+    _ensure_punkt()
+    art = Article(url=base_url or "")
+    art.set_html(page_html)
+    art.parse()
+    if art.text and len(art.text) > 200:
+        return _wrap_paras([p for p in (x.strip() for x in art.text.split("\n")) if p])
+    return None
 
-    # 3) Newspaper3k fallback
-    try:
-        try:
-            # Ensure tokenizer exists (best effort)
-            nltk.data.find("tokenizers/punkt")
-        except Exception:
-            nltk.download("punkt", quiet=True)
-        art = Article(url=base_url or "")
-        art.set_html(page_html)
-        art.parse()
-        if art.text and len(art.text) > 200:
-            paras = [p.strip() for p in art.text.split("\n") if p.strip()]
-            html_out = "".join(f"<p>{p}</p>" for p in paras)
-            return html_out, "newspaper3k"
-    except Exception:
-        pass
 
-    # Fallback: heuristic with BeautifulSoup
+def _extract_heuristic(page_html: str, base_url: Optional[str]) -> Optional[str]:
     try:
         soup = BeautifulSoup(page_html, "lxml")
     except Exception:
@@ -591,7 +930,7 @@ def extract_main_html(page_html: str, base_url: Optional[str] = None) -> Tuple[O
     for sel in candidates:
         node = soup.find(**sel)
         if node and len(node.get_text(strip=True)) > 120:
-            return str(node), "heuristic"
+            return str(node)
 
     # Last resort: largest text block
     best = None
@@ -602,5 +941,42 @@ def extract_main_html(page_html: str, base_url: Optional[str] = None) -> Tuple[O
             best = div
             best_len = txt_len
     if best and best_len > 120:
-        return str(best), "heuristic"
+        return str(best)
+    return None
+
+
+# Tried in order: trafilatura, then readability, then newspaper3k, then a
+# BeautifulSoup container heuristic
+_EXTRACTORS = (
+    (_extract_trafilatura, "trafilatura"),
+    (_extract_readability, "readability"),
+    (_extract_newspaper, "newspaper3k"),
+    (_extract_heuristic, "heuristic"),
+)
+
+
+def extract_main_html(page_html: str, base_url: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    # Plaintext input (e.g., from r.jina.ai) → wrap into paragraphs
+    if _is_plaintext(page_html):
+        lines = [ln.strip() for ln in page_html.splitlines()]
+        paras: List[str] = []
+        buf: List[str] = []
+        for ln in lines:
+            if ln:
+                buf.append(ln)
+            elif buf:
+                paras.append(" ".join(buf))
+                buf = []
+        if buf:
+            paras.append(" ".join(buf))
+        if paras:
+            return _wrap_paras(paras), "plaintext"
+    # First extractor yielding enough text wins; later backends never run
+    for extractor, source in _EXTRACTORS:
+        try:
+            html_out = extractor(page_html, base_url)
+        except Exception:
+            continue
+        if html_out:
+            return html_out, source
     return None, None
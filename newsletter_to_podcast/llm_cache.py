@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Responses keyed by sha256(model, system prompt, input); re-runs and
+# overlapping editions reuse earlier LLM output instead of paying for it again
+CACHE_PATH = os.path.join("data", "llm_cache.sqlite")
+
+
+def cache_key(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def normalize_text(text: str) -> str:
+    # Paragraphs with runs of whitespace collapsed: re-extracted copies of the
+    # same story that differ only in spacing or line wrapping share a key
+    return "\n\n".join(" ".join(p.split()) for p in text.split("\n\n") if p.strip())
+
+
+@functools.lru_cache(maxsize=None)
+def _connect(path: str) -> Optional[sqlite3.Connection]:
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.commit()
+        return conn
+    except Exception as e:  # noqa: BLE001
+        logger.info("LLM cache unavailable", extra={"path": path, "error": str(e)})
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _purge_expired(path: str, ttl_s: float) -> None:
+    # Once per process and TTL: rows past it can never be served again, so
+    # drop them instead of letting the file grow in the Actions cache
+    conn = _connect(path)
+    if conn is None:
+        return
+    try:
+        with conn:
+            removed = conn.execute("DELETE FROM cache WHERE created < ?", (time.time() - ttl_s,)).rowcount
+        if removed:
+            logger.info("Purged expired LLM cache rows", extra={"removed": removed})
+    except Exception as e:  # noqa: BLE001
+        logger.debug("LLM cache purge failed", extra={"error": str(e)})
+
+
+def get(key: str, ttl_s: Optional[float] = None) -> Optional[str]:
+    conn = _connect(CACHE_PATH)
+    if conn is None:
+        return None
+    if ttl_s:
+        _purge_expired(CACHE_PATH, ttl_s)
+    try:
+        row = conn.execute("SELECT value, created FROM cache WHERE key = ?", (key,)).fetchone()
+    except Exception:
+        return None
+    if not row:
+        return None
+    if ttl_s and time.time() - row[1] > ttl_s:
+        return None
+    return row[0]
+
+
+def put(key: str, value: str) -> None:
+    conn = _connect(CACHE_PATH)
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+    except Exception as e:  # noqa: BLE001
+        logger.debug("LLM cache write failed", extra={"error": str(e)})
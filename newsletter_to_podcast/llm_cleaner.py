@@ -1,25 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Optional, List
+import re
+from typing import List, Optional
 
 from .config import AppConfig
 from .cleaner import strip_emoji
+from .llm_common import (
+    MAX_CONCURRENT_CHUNKS,
+    build_batch_body,
+    group_chunks,
+    load_prompt,
+    split_batch_reply,
+    split_chunks,
+)
 
 logger = logging.getLogger(__name__)
 
 
 def _get_openai_client(api_key: Optional[str]):
     try:
-        from openai import OpenAI  # type: ignore
+        from openai import AsyncOpenAI  # type: ignore
     except Exception:
         return None, None
     if not api_key:
         return None, None
     try:
-        client = OpenAI(api_key=api_key)
-        return client, OpenAI
+        client = AsyncOpenAI(api_key=api_key)
+        return client, AsyncOpenAI
     except Exception:
         return None, None
 
@@ -40,28 +50,93 @@ SYSTEM_PROMPT = (
 )
 
 
-def _clean_chunk_with_openai(client, model: str, chunk: str, system_prompt: str) -> Optional[str]:
+# Artifacts SYSTEM_PROMPT asks the model to remove. Chunks with none of these
+# are already clean for TTS and are not sent at all
+_DIRTY_PAT = re.compile(
+    r"\*\*|__|`|\]\(https?://|^\s*[-*•]\s"
+    r"|\b(?:Photo|Photograph|Credit|Courtesy|Title|Published Time|Publish Time|Illustration):"
+    r"|Image \d+:|URL Source|Markdown Content|Share this story|^\s*Thanks to\b"
+    r"|via Getty|AP Photo|Reuters|Bloomberg|AFP",
+    re.MULTILINE,
+)
+
+
+async def _complete(client, model: str, system_prompt: str, user_content: str) -> Optional[str]:
+    resp = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ],
+        temperature=0.2,
+    )
+    out = resp.choices[0].message.content if resp and resp.choices else None
+    return out.strip() if out else None
+
+
+async def _clean_chunk_with_openai(client, model: str, chunk: str, system_prompt: str) -> Optional[str]:
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": (
-                        "Clean this newsletter excerpt for TTS. Return plain text only.\n\n" + chunk
-                    ),
-                },
-            ],
-            temperature=0.2,
+        return await _complete(
+            client,
+            model,
+            system_prompt,
+            "Clean this newsletter excerpt for TTS. Return plain text only.\n\n" + chunk,
         )
-        out = resp.choices[0].message.content if resp and resp.choices else None
-        return out.strip() if out else None
     except Exception as e:  # noqa: BLE001
         logger.warning("LLM clean chunk failed", extra={"error": str(e)})
         return None
 
 
+async def _clean_batch_with_openai(client, model: str, batch: List[str], system_prompt: str) -> List[Optional[str]]:
+    if len(batch) == 1:
+        return [await _clean_chunk_with_openai(client, model, batch[0], system_prompt)]
+    try:
+        reply = await _complete(
+            client,
+            model,
+            system_prompt,
+            build_batch_body(
+                "Clean each newsletter excerpt below for TTS. Return plain text only.",
+                batch,
+                "that excerpt's cleaned text",
+            ),
+        )
+        parsed = split_batch_reply(reply or "", len(batch))
+        if parsed is not None:
+            return parsed
+        logger.info("LLM batch reply lost its markers; cleaning chunks one by one", extra={"chunks": len(batch)})
+    except Exception as e:  # noqa: BLE001
+        logger.warning("LLM clean batch failed", extra={"error": str(e)})
+    return [await _clean_chunk_with_openai(client, model, ch, system_prompt) for ch in batch]
+
+
+async def _clean_chunks(client, model: str, chunks: List[str], system_prompt: str) -> List[Optional[str]]:
+    # Independent network-bound requests: run them together, bounded by a
+    # semaphore; gather keeps results in chunk order
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def _one(batch: List[str]) -> List[Optional[str]]:
+        async with sem:
+            return await _clean_batch_with_openai(client, model, batch, system_prompt)
+
+    try:
+        results = await asyncio.gather(*(_one(b) for b in group_chunks(chunks)))
+        return [out for batch_out in results for out in batch_out]
+    finally:
+        # The client's connection pool belongs to this event loop
+        await client.close()
+
+
+def _maybe_strip_emoji(text: str, cfg: AppConfig) -> str:
+    # Ensure emojis are removed if configured, whether or not anything was sent
+    try:
+        if getattr(cfg, "clean", None) and getattr(cfg.clean, "remove_emoji", False):
+            return strip_emoji(text)
+    except Exception:
+        pass
+    return text
+
+
 def maybe_clean_text_with_llm(text: str, cfg: AppConfig) -> str:
     llm = getattr(cfg, "llm", None)
     if not llm or not getattr(llm, "enabled", False):
@@ -69,6 +144,10 @@ def maybe_clean_text_with_llm(text: str, cfg: AppConfig) -> str:
     if getattr(llm, "provider", "openai") != "openai":
         return text
 
+    if not _DIRTY_PAT.search(text):
+        logger.info("LLM cleaning skipped: no artifacts to clean", extra={"len": len(text)})
+        return _maybe_strip_emoji(text, cfg)
+
     api_key = os.environ.get(getattr(llm, "api_key_env", "OPENAI_API_KEY"))
     client, _ = _get_openai_client(api_key)
     if client is None:
@@ -77,44 +156,24 @@ def maybe_clean_text_with_llm(text: str, cfg: AppConfig) -> str:
 
     # Resolve system prompt: external file takes precedence if configured
     system_prompt = SYSTEM_PROMPT
-    try:
-        prompt_path = getattr(getattr(cfg, "llm", None), "clean_prompt_file", None)
-        if prompt_path and os.path.exists(prompt_path):
-            with open(prompt_path, "r", encoding="utf-8") as pf:
-                content = pf.read().strip()
-                if content:
-                    system_prompt = content
-    except Exception:
-        pass
+    prompt_path = getattr(getattr(cfg, "llm", None), "clean_prompt_file", None)
+    if prompt_path:
+        system_prompt = load_prompt(prompt_path) or system_prompt
 
     # Soft chunking by paragraph to ~3500 chars per chunk
-    paras: List[str] = text.split("\n\n")
-    chunks: List[str] = []
-    buf = []
-    total = 0
-    for p in paras:
-        if total + len(p) + 2 > 3500 and buf:
-            chunks.append("\n\n".join(buf))
-            buf = [p]
-            total = len(p)
-        else:
-            buf.append(p)
-            total += len(p) + 2
-    if buf:
-        chunks.append("\n\n".join(buf))
-
-    cleaned_parts: List[str] = []
-    model = getattr(llm, "model", "gpt-4o-mini")
-    for idx, ch in enumerate(chunks):
-        out = _clean_chunk_with_openai(client, model, ch, system_prompt)
-        cleaned_parts.append(out if out else ch)
+    chunks = split_chunks(text, 3500)
 
-    result = "\n\n".join(cleaned_parts)
-    # Ensure emojis are removed if configured
+    model = getattr(llm, "model", "gpt-4o-mini")
+    outs: List[Optional[str]] = [None] * len(chunks)
+    dirty = [i for i, ch in enumerate(chunks) if _DIRTY_PAT.search(ch)]
     try:
-        if getattr(cfg, "clean", None) and getattr(cfg.clean, "remove_emoji", False):
-            result = strip_emoji(result)
-    except Exception:
-        pass
-    logger.info("LLM cleaned text", extra={"chunks": len(chunks), "orig_len": len(text), "clean_len": len(result)})
+        results = asyncio.run(_clean_chunks(client, model, [chunks[i] for i in dirty], system_prompt))
+        for i, out in zip(dirty, results):
+            outs[i] = out
+    except Exception as e:  # noqa: BLE001
+        logger.warning("LLM clean failed", extra={"error": str(e)})
+    cleaned_parts: List[str] = [out if out else ch for ch, out in zip(chunks, outs)]
+
+    result = _maybe_strip_emoji("\n\n".join(cleaned_parts), cfg)
+    logger.info("LLM cleaned text", extra={"chunks": len(chunks), "sent": len(dirty), "orig_len": len(text), "clean_len": len(result)})
     return result
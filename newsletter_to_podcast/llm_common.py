@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+# Helpers shared by llm_cleaner and llm_rewriter: prompt files, paragraph
+# chunking and the numbered-marker protocol for several chunks per request
+
+
+# Prompt file contents keyed by (path, mtime): read at most once per edit
+_PROMPT_CACHE: Dict[Tuple[str, int], Optional[str]] = {}
+
+
+def load_prompt(prompt_path: str) -> Optional[str]:
+    # The system message must also stay byte-identical across requests for
+    # OpenAI's prompt-prefix caching to apply
+    try:
+        key = (prompt_path, os.stat(prompt_path).st_mtime_ns)
+    except OSError:
+        return None
+    if key not in _PROMPT_CACHE:
+        try:
+            with open(prompt_path, "r", encoding="utf-8") as pf:
+                _PROMPT_CACHE[key] = pf.read().strip() or None
+        except Exception:
+            return None
+    return _PROMPT_CACHE[key]
+
+
+# Chunks sent concurrently; keeps bursts under typical per-minute limits
+MAX_CONCURRENT_CHUNKS = 4
+
+# Several chunks share one request (and one copy of the system prompt); the
+# model echoes numbered marker lines so the reply can be split back apart
+BATCH_MAX_CHUNKS = 4
+BATCH_MAX_CHARS = 12000
+_MARKER_PAT = re.compile(r"^<<<CHUNK (\d+)>>>[ \t]*$", re.MULTILINE)
+
+
+def split_chunks(text: str, limit: int) -> List[str]:
+    # Soft chunking by paragraph to about `limit` chars. Paragraphs sit between
+    # "\n\n" separators, so each chunk is one slice of the text (no split into
+    # a paragraph list, no re-join per chunk)
+    chunks: List[str] = []
+    start = pos = total = 0
+    while True:
+        end = text.find("\n\n", pos)
+        if end == -1:
+            end = len(text)
+        size = end - pos
+        if total + size + 2 > limit and pos > 0:
+            chunks.append(text[start : pos - 2])
+            start = pos
+            total = size
+        else:
+            total += size + 2
+        if end == len(text):
+            break
+        pos = end + 2
+    chunks.append(text[start:])
+    return chunks
+
+
+def group_chunks(chunks: List[str], max_chars: int = BATCH_MAX_CHARS) -> List[List[str]]:
+    # Consecutive chunks, at most BATCH_MAX_CHUNKS / max_chars per group. Pass
+    # the same limit the chunks were split to, or no two of them ever fit
+    groups: List[List[str]] = []
+    size = 0
+    for ch in chunks:
+        if groups and len(groups[-1]) < BATCH_MAX_CHUNKS and size + len(ch) <= max_chars:
+            groups[-1].append(ch)
+            size += len(ch)
+        else:
+            groups.append([ch])
+            size = len(ch)
+    return groups
+
+
+def build_batch_body(task: str, chunks: List[str], each_result: str) -> str:
+    # User turn for a multi-chunk request: the task line, the marker
+    # instruction, then every chunk behind its numbered marker
+    body = "\n\n".join(f"<<<CHUNK {i}>>>\n{ch}" for i, ch in enumerate(chunks, 1))
+    return (
+        f"{task}\n"
+        f"Keep every marker line (<<<CHUNK 1>>> through <<<CHUNK {len(chunks)}>>>) exactly as given, "
+        f"on its own line, followed by {each_result}.\n\n" + body
+    )
+
+
+def split_batch_reply(reply: str, n: int) -> Optional[List[Optional[str]]]:
+    # Expect exactly markers 1..n in order; anything else means the protocol broke
+    pieces = _MARKER_PAT.split(reply)
+    if [int(x) for x in pieces[1::2]] != list(range(1, n + 1)):
+        return None
+    return [body.strip() or None for body in pieces[2::2]]
@@ -1,14 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
 import os
-from typing import List, Optional
+import random
+import time
+from typing import List, Optional, Tuple
 
+from . import llm_cache
 from .config import AppConfig
+from .llm_common import (
+    BATCH_MAX_CHARS,
+    MAX_CONCURRENT_CHUNKS,
+    build_batch_body,
+    group_chunks,
+    load_prompt,
+    split_batch_reply,
+    split_chunks,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Batch API status checks while waiting for a submitted batch
+BATCH_POLL_INTERVAL_S = 15.0
+# Transient API errors (429, 5xx, timeouts) are retried with jittered
+# exponential backoff before a chunk falls back to its original text
+MAX_ATTEMPTS = 3
+INITIAL_RETRY_DELAY_S = 1.0
+MAX_RETRY_DELAY_S = 20.0
+# Replies are streamed; a stream silent for this long is treated as stalled
+# and retried instead of waiting out the full HTTP timeout
+STREAM_IDLE_TIMEOUT_S = 60.0
+# Visual-only references the rewrite exists to remove
+_VISUAL_MARKERS = ("see chart", "image:", "figure ", "below:", "above:", "<")
+
+
+def _needs_rewrite(text: str) -> bool:
+    # Cheap gate: short sentences with nothing visual and a modest length
+    # already read well aloud, so no request is made for them
+    if len(text) > 5000:
+        return True
+    sentences = text.count(".") + text.count("!") + text.count("?")
+    if len(text) / max(1, sentences) > 25:
+        return True
+    lowered = text.lower()
+    return any(k in lowered for k in _VISUAL_MARKERS)
+
+
 # Default, used when no external prompt file is provided
 REWRITE_SYSTEM_PROMPT = (
     "You are a professional audio editor and voice adaptation expert.\n"
@@ -27,36 +68,292 @@ REWRITE_SYSTEM_PROMPT = (
 )
 
 
+@functools.lru_cache(maxsize=4)
 def _get_openai_client(api_key: Optional[str]):
+    # One client per key for the process: its connection pool (and TLS
+    # sessions) carry over between newsletters. See _event_loop()
     try:
-        from openai import OpenAI  # type: ignore
+        from openai import AsyncOpenAI  # type: ignore
     except Exception:
         return None, None
     if not api_key:
         return None, None
     try:
-        client = OpenAI(api_key=api_key)
-        return client, OpenAI
+        # Retries are handled by _complete (transient errors only)
+        client = AsyncOpenAI(api_key=api_key, max_retries=0)
+        return client, AsyncOpenAI
     except Exception:
         return None, None
 
 
-def _rewrite_chunk_with_openai(client, model: str, chunk: str, system_prompt: str) -> Optional[str]:
+@functools.lru_cache(maxsize=1)
+def _event_loop() -> asyncio.AbstractEventLoop:
+    # Async clients are bound to the loop that opened their connections, so
+    # every rewrite runs on this one loop instead of a fresh asyncio.run()
+    return asyncio.new_event_loop()
+
+
+@functools.lru_cache(maxsize=None)
+def _rate_limiter(requests_per_minute: float, tokens_per_minute: float) -> Optional[_RateLimiter]:
+    # One limiter per (RPM, TPM) for the process, like the loop above: every
+    # rewrite of a run draws on the same buckets instead of a full new pair
+    if requests_per_minute <= 0 or tokens_per_minute <= 0:
+        return None
+    return _RateLimiter(requests_per_minute, tokens_per_minute)
+
+
+def _cached_tokens(resp) -> int:
+    # Prompt tokens OpenAI served from its prefix cache (0 when not reported)
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": chunk},
-            ],
-            temperature=0.4,
-        )
-        out = resp.choices[0].message.content if resp and resp.choices else None
-        return out.strip() if out else None
+        return int(resp.usage.prompt_tokens_details.cached_tokens or 0)
+    except Exception:
+        return 0
+
+
+class _RateLimiter:
+    """Request and token buckets refilled continuously at per-minute limits.
+
+    Requests wait here instead of bursting past the account's RPM/TPM and
+    spending their retries on 429s. One instance per process and limit pair
+    (see _rate_limiter), used only on _event_loop().
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.requests = requests_per_minute
+        self.tokens = tokens_per_minute
+        self.updated = time.monotonic()
+
+    async def acquire(self, tokens: int) -> None:
+        # A request larger than the whole bucket waits for a full bucket
+        tokens = min(tokens, self.tpm)
+        while True:
+            now = time.monotonic()
+            elapsed = now - self.updated
+            self.updated = now
+            self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+            if self.requests >= 1 and self.tokens >= tokens:
+                self.requests -= 1
+                self.tokens -= tokens
+                return
+            wait = max((1 - self.requests) * 60.0 / self.rpm, (tokens - self.tokens) * 60.0 / self.tpm)
+            await asyncio.sleep(max(wait, 0.01))
+
+
+# Rough English average for OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(system_prompt: str, user_content: str) -> int:
+    # Input estimate plus headroom for the reply
+    return (len(system_prompt) + len(user_content)) // CHARS_PER_TOKEN + 512
+
+
+def _is_transient(e: Exception) -> bool:
+    try:
+        import httpx  # type: ignore
+        import openai  # type: ignore
+    except Exception:
+        return False
+    # A connection dropped mid-stream surfaces from _read_stream as a raw
+    # httpx.TransportError, outside the SDK's APIConnectionError wrapping
+    return isinstance(
+        e,
+        (
+            openai.RateLimitError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+            asyncio.TimeoutError,
+            httpx.TransportError,
+        ),
+    )
+
+
+async def _read_stream(stream) -> Tuple[str, int]:
+    # Collect streamed deltas; the final event carries usage (include_usage)
+    parts: List[str] = []
+    n_cached = 0
+    it = stream.__aiter__()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(it.__anext__(), STREAM_IDLE_TIMEOUT_S)
+            except StopAsyncIteration:
+                break
+            if event.choices:
+                delta = event.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if getattr(event, "usage", None) is not None:
+                n_cached = _cached_tokens(event)
+    finally:
+        # Release the connection even when the stream stalled part-way
+        close = getattr(stream, "close", None)
+        if close is not None:
+            await close()
+    return "".join(parts), n_cached
+
+
+async def _complete(
+    client, model: str, system_prompt: str, user_content: str, limiter: Optional[_RateLimiter] = None
+) -> Tuple[Optional[str], int]:
+    attempt = 0
+    delay = INITIAL_RETRY_DELAY_S
+    while True:
+        attempt += 1
+        if limiter is not None:
+            await limiter.acquire(_estimate_tokens(system_prompt, user_content))
+        try:
+            # Stable system message first, per-request content only in the user turn
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content},
+                ],
+                temperature=0.4,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            out, n_cached = await _read_stream(stream)
+            break
+        except Exception as e:  # noqa: BLE001
+            if attempt >= MAX_ATTEMPTS or not _is_transient(e):
+                raise
+            logger.warning("LLM rewrite request failed; retrying", extra={"attempt": attempt, "error": str(e)})
+            await asyncio.sleep(random.uniform(0, delay))
+            delay = min(delay * 2, MAX_RETRY_DELAY_S)
+    return (out.strip() or None), n_cached
+
+
+async def _rewrite_chunk_with_openai(
+    client, model: str, chunk: str, system_prompt: str, limiter: Optional[_RateLimiter] = None
+) -> Tuple[Optional[str], int]:
+    try:
+        return await _complete(client, model, system_prompt, chunk, limiter)
     except Exception as e:  # noqa: BLE001
         logger.warning("LLM rewrite chunk failed", extra={"error": str(e)})
+        return None, 0
+
+
+async def _rewrite_group_with_openai(
+    client, model: str, group: List[str], system_prompt: str, limiter: Optional[_RateLimiter] = None
+) -> List[Tuple[Optional[str], int]]:
+    # Several chunks per request behind numbered markers (same protocol as
+    # the cleaner); a reply that loses its markers is redone chunk by chunk
+    if len(group) == 1:
+        return [await _rewrite_chunk_with_openai(client, model, group[0], system_prompt, limiter)]
+    try:
+        reply, n_cached = await _complete(
+            client,
+            model,
+            system_prompt,
+            build_batch_body(
+                "Rewrite each section below independently, in order.",
+                group,
+                "that section's rewritten text",
+            ),
+            limiter,
+        )
+        parsed = split_batch_reply(reply or "", len(group))
+        if parsed is not None:
+            return [(out, n_cached if i == 0 else 0) for i, out in enumerate(parsed)]
+        logger.info("LLM rewrite reply lost its markers; rewriting chunks one by one", extra={"chunks": len(group)})
+    except Exception as e:  # noqa: BLE001
+        logger.warning("LLM rewrite batch failed", extra={"error": str(e)})
+    return [await _rewrite_chunk_with_openai(client, model, ch, system_prompt, limiter) for ch in group]
+
+
+async def _rewrite_chunks_batch(
+    client, model: str, chunks: List[str], system_prompt: str, timeout_s: float
+) -> Optional[List[Tuple[Optional[str], int]]]:
+    # OpenAI Batch API: half-price tokens, results arrive asynchronously.
+    # None when the batch cannot be submitted or does not finish in time
+    lines = [
+        json.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": ch},
+                    ],
+                    "temperature": 0.4,
+                },
+            },
+            ensure_ascii=False,
+        )
+        for i, ch in enumerate(chunks)
+    ]
+    try:
+        upload = await client.files.create(
+            file=("rewrite_batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=upload.id, endpoint="/v1/chat/completions", completion_window="24h"
+        )
+        deadline = time.monotonic() + timeout_s
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                logger.info("LLM rewrite batch still pending; cancelling", extra={"batch_id": batch.id})
+                await client.batches.cancel(batch.id)
+                return None
+            await asyncio.sleep(BATCH_POLL_INTERVAL_S)
+            batch = await client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning("LLM rewrite batch did not complete", extra={"batch_id": batch.id, "status": batch.status})
+            return None
+        output = (await client.files.content(batch.output_file_id)).text
+    except Exception as e:  # noqa: BLE001
+        logger.warning("LLM rewrite batch failed", extra={"error": str(e)})
         return None
 
+    results: List[Tuple[Optional[str], int]] = [(None, 0)] * len(chunks)
+    for line in output.splitlines():
+        try:
+            rec = json.loads(line)
+            body = rec["response"]["body"]
+            out = body["choices"][0]["message"]["content"]
+            details = (body.get("usage") or {}).get("prompt_tokens_details") or {}
+            results[int(rec["custom_id"])] = ((out.strip() if out else None) or None, int(details.get("cached_tokens") or 0))
+        except Exception:
+            continue
+    return results
+
+
+async def _rewrite_chunks(
+    client,
+    model: str,
+    chunks: List[str],
+    system_prompt: str,
+    batch_timeout_s: Optional[float] = None,
+    limiter: Optional[_RateLimiter] = None,
+    max_group_chars: int = BATCH_MAX_CHARS,
+) -> List[Tuple[Optional[str], int]]:
+    # Independent network-bound requests: run them together, bounded by a
+    # semaphore and (when limits are set) the RPM/TPM token buckets; gather
+    # keeps results in chunk order
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def _one(group: List[str]) -> List[Tuple[Optional[str], int]]:
+        async with sem:
+            return await _rewrite_group_with_openai(client, model, group, system_prompt, limiter)
+
+    results: List[Tuple[Optional[str], int]] = [(None, 0)] * len(chunks)
+    if batch_timeout_s and chunks:
+        results = await _rewrite_chunks_batch(client, model, chunks, system_prompt, batch_timeout_s) or results
+    # Whatever the batch did not return goes out as regular requests
+    todo = [i for i, (out, _) in enumerate(results) if out is None]
+    groups = await asyncio.gather(*(_one(g) for g in group_chunks([chunks[i] for i in todo], max_group_chars)))
+    for i, res in zip(todo, (res for group in groups for res in group)):
+        results[i] = res
+    return results
+
 
 def maybe_rewrite_for_audio(text: str, cfg: AppConfig) -> str:
     llm = getattr(cfg, "llm", None)
@@ -65,57 +362,70 @@ def maybe_rewrite_for_audio(text: str, cfg: AppConfig) -> str:
     if getattr(llm, "provider", "openai") != "openai":
         return text
 
-    api_key_env = getattr(llm, "api_key_env", "OPENAI_API_KEY")
-    api_key = os.environ.get(api_key_env)
-    client, _ = _get_openai_client(api_key)
-    if client is None:
-        logger.info("LLM rewrite skipped: client not available or api key missing")
-        return text
-
-    # Resolve system prompt: external file takes precedence if configured
-    system_prompt = REWRITE_SYSTEM_PROMPT
-    try:
-        prompt_path = getattr(getattr(cfg, "llm", None), "rewrite_prompt_file", None)
-        if prompt_path and os.path.exists(prompt_path):
-            with open(prompt_path, "r", encoding="utf-8") as pf:
-                content = pf.read().strip()
-                if content:
-                    system_prompt = content
-    except Exception:
-        pass
-
     # If input is too short, skip rewrite to avoid generic filler intros
     try:
         if len(text.strip()) < 200:
             return text
     except Exception:
         pass
+    if not _needs_rewrite(text):
+        logger.info("LLM rewrite skipped: text already reads as spoken", extra={"len": len(text)})
+        return text
+
+    # Resolve system prompt: external file takes precedence if configured
+    system_prompt = REWRITE_SYSTEM_PROMPT
+    prompt_path = getattr(getattr(cfg, "llm", None), "rewrite_prompt_file", None)
+    if prompt_path:
+        system_prompt = load_prompt(prompt_path) or system_prompt
+
+    # Soft chunk by paragraphs, sized to the model's input budget rather than
+    # a fixed char count: fewer, larger requests and fewer prompt replays
+    max_input_tokens = int(getattr(llm, "max_input_tokens", 6000) or 6000)
+    chunk_chars = max_input_tokens * CHARS_PER_TOKEN
+    chunks = split_chunks(text, chunk_chars)
 
-    # Soft chunk by paragraphs to ~3000-3500 chars
-    paras: List[str] = text.split("\n\n")
-    chunks: List[str] = []
-    buf: List[str] = []
-    total = 0
-    for p in paras:
-        if total + len(p) + 2 > 3200 and buf:
-            chunks.append("\n\n".join(buf))
-            buf = [p]
-            total = len(p)
-        else:
-            buf.append(p)
-            total += len(p) + 2
-    if buf:
-        chunks.append("\n\n".join(buf))
-
-    out_parts: List[str] = []
     model = getattr(llm, "rewrite_model", "gpt-4o")
-    for ch in chunks:
-        out = _rewrite_chunk_with_openai(client, model, ch, system_prompt)
-        out_parts.append(out if out else ch)
+    ttl_s = getattr(llm, "cache_ttl_s", None)
+    # Chunks rewritten by an earlier run with the same model and prompt are
+    # served from the response cache; only the rest are sent
+    keys = [llm_cache.cache_key(model, system_prompt, llm_cache.normalize_text(ch)) for ch in chunks]
+    outs: List[Optional[str]] = [llm_cache.get(k, ttl_s) for k in keys]
+    misses = [i for i, out in enumerate(outs) if out is None]
+    # openai is imported and the client built only once a request will be made
+    client = None
+    if misses:
+        api_key_env = getattr(llm, "api_key_env", "OPENAI_API_KEY")
+        api_key = os.environ.get(api_key_env)
+        client, _ = _get_openai_client(api_key)
+        if client is None:
+            logger.info("LLM rewrite skipped: client not available or api key missing")
+            return text
+    cached_tokens = 0
+    batch_timeout_s = getattr(llm, "batch_timeout_s", None) if getattr(llm, "batch_mode", False) else None
+    limiter = _rate_limiter(
+        float(getattr(llm, "max_requests_per_minute", 0) or 0),
+        float(getattr(llm, "max_tokens_per_minute", 0) or 0),
+    )
+    try:
+        results = []
+        if misses:
+            results = _event_loop().run_until_complete(
+                _rewrite_chunks(
+                    client, model, [chunks[i] for i in misses], system_prompt, batch_timeout_s, limiter, chunk_chars
+                )
+            )
+        for i, (out, n_cached) in zip(misses, results):
+            outs[i] = out
+            cached_tokens += n_cached
+            if out:
+                llm_cache.put(keys[i], out)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("LLM rewrite failed", extra={"error": str(e)})
+    out_parts: List[str] = [out if out else ch for ch, out in zip(chunks, outs)]
 
     result = "\n\n".join(out_parts)
     logger.info(
         "LLM audio rewrite done",
-        extra={"chunks": len(chunks), "orig_len": len(text), "rewritten_len": len(result)},
+        extra={"chunks": len(chunks), "cached": len(chunks) - len(misses), "prompt_cached_tokens": cached_tokens, "orig_len": len(text), "rewritten_len": len(result)},
     )
     return result
@@ -6,53 +6,94 @@ import os
 import sys
 from typing import Any, Dict
 
+try:
+    import orjson  # optional: several times faster than json.dumps per record
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+# LogRecord's own attributes; everything else on a record came from `extra`
+_EXCLUDE = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "created",
+    }
+)
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
 
 class JsonFormatter(logging.Formatter):
+    # (whole second, formatted time): the timestamp has one-second resolution,
+    # so records logged within the same second share one strftime call
+    _last_time = (None, "")
+
+    def _time(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        last = self._last_time
+        if last[0] != sec:
+            last = (sec, self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S%z"))
+            self._last_time = last
+        return last[1]
+
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
         payload: Dict[str, Any] = {
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
-            "time": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S%z"),
+            "time": self._time(record),
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
         # Include any custom attributes set via logging `extra={...}`
-        exclude = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "lineno",
-            "funcName",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "created",
-        }
-        for k, v in record.__dict__.items():
-            if k not in exclude and k not in payload and not k.startswith("_"):
+        extras = [
+            (k, v)
+            for k, v in record.__dict__.items()
+            if k not in _EXCLUDE and k not in payload and not k.startswith("_")
+        ]
+        payload.update(extras)
+        try:
+            return _dumps(payload)
+        except Exception:
+            # Only when something is not serializable: stringify those values
+            for k, v in extras:
                 try:
-                    json.dumps(v)  # check serializable
-                    payload[k] = v
+                    _dumps(v)
                 except Exception:
                     payload[k] = str(v)
-        return json.dumps(payload, ensure_ascii=False)
+            return _dumps(payload)
 
 
 def setup_logging(level: str = "INFO") -> None:
     lvl = getattr(logging, level.upper(), logging.INFO)
+    # Records below `lvl` are dropped by the logger before any formatting.
+    # Thread/process details are never written out, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     root = logging.getLogger()
     root.setLevel(lvl)
     handler = logging.StreamHandler(sys.stdout)
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
 import datetime as dt
+import email.utils
+import functools
+import io
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from dateutil import parser as dateparser
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import ID3, WOAF
+from mutagen import PaddingInfo
+from mutagen.id3 import ID3, TDRC, TIT2, TPE1, WOAF
 
 from .config import AppConfig, load_config, validate_config
-from .fetcher import fetch_feed
-from .cleaner import clean_html_text
+from .fetcher import fetch_feed, prune_page_cache
+from .cleaner import clean_html_batch
 from .logger import setup_logging, gha_notice
 from .rss import render_rss, render_index_html
-from .storage import ensure_dirs, load_state, save_state, sha256, slugify
-from .tts import synthesize_mp3
-from .tts_openai import synthesize_mp3_openai
+from .storage import ensure_dirs, load_state, save_state, sha256, sha256_many, slugify, write_if_changed
+from .tts import synthesize_mp3_parts
+from .tts_openai import synthesize_mp3_openai_parts
 from .llm_cleaner import maybe_clean_text_with_llm
 from .llm_rewriter import maybe_rewrite_for_audio
 
@@ -25,16 +29,54 @@ from .llm_rewriter import maybe_rewrite_for_audio
 logger = logging.getLogger(__name__)
 
 
+# Title date formats tried by extract_date_from_title, compiled once
+_RE_NUMERIC_DATE = re.compile(r"(20\d{2})[-/.](\d{1,2})[-/.](\d{1,2})")
+_RE_CJK_DATE = re.compile(r"(20\d{2})年(\d{1,2})月(\d{1,2})日")
+_RE_ENGLISH_MONTH = re.compile(
+    r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December)\b",
+    re.IGNORECASE,
+)
+# "October 15, 2025" / "Oct. 15 2025": read straight from the match groups
+_RE_ENGLISH_DATE = re.compile(
+    r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December)"
+    r"\.?\s+(\d{1,2}),?\s+(20\d{2})\b",
+    re.IGNORECASE,
+)
+_MONTHS = {m: i for i, m in enumerate(("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+
+
 def parse_datetime(s: str) -> dt.datetime:
+    v = _parse_datetime_cached(s)
+    return v if v is not None else dt.datetime.now(dt.timezone.utc)
+
+
+# The same published strings are parsed by several passes of a run. Failures
+# are cached too, as None; parse_datetime turns that into the current time on
+# every call, so a failed parse never returns a stale timestamp
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_cached(s: str) -> Optional[dt.datetime]:
+    # Feeds publish ISO-8601 or RFC-2822 dates; the format-specific parsers
+    # handle those far faster than dateutil, which stays the fallback
+    try:
+        return _with_utc(dt.datetime.fromisoformat(s))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return _with_utc(email.utils.parsedate_to_datetime(s))
+    except (TypeError, ValueError, IndexError):
+        pass
     try:
         v = dateparser.parse(s)
         if v is None:
-            return dt.datetime.now(dt.timezone.utc)
-        if v.tzinfo is None:
-            v = v.replace(tzinfo=dt.timezone.utc)
-        return v
+            return None
+        return _with_utc(v)
     except Exception:
-        return dt.datetime.now(dt.timezone.utc)
+        return None
+
+
+def _with_utc(v: dt.datetime) -> dt.datetime:
+    return v.replace(tzinfo=dt.timezone.utc) if v.tzinfo is None else v
+
 
 def extract_date_from_title(title: str) -> dt.date | None:
     """Try to extract a date from the article title.
@@ -48,7 +90,7 @@ def extract_date_from_title(title: str) -> dt.date | None:
         return None
 
     # 1) Explicit numeric formats
-    m = re.search(r"(20\d{2})[-/.](\d{1,2})[-/.](\d{1,2})", title)
+    m = _RE_NUMERIC_DATE.search(title)
     if m:
         y, mo, d = map(int, m.groups())
         try:
@@ -57,7 +99,7 @@ def extract_date_from_title(title: str) -> dt.date | None:
             pass
 
     # 2) Chinese format: 2025年10月15日
-    m = re.search(r"(20\d{2})年(\d{1,2})月(\d{1,2})日", title)
+    m = _RE_CJK_DATE.search(title)
     if m:
         y, mo, d = map(int, m.groups())
         try:
@@ -66,8 +108,14 @@ def extract_date_from_title(title: str) -> dt.date | None:
             pass
 
     # 3) English month name: October 15, 2025 (or Oct 15, 2025)
-    # Use dateutil to parse if a month name is present
-    if re.search(r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December)\b", title, re.IGNORECASE):
+    m = _RE_ENGLISH_DATE.search(title)
+    if m:
+        try:
+            return dt.date(int(m.group(3)), _MONTHS[m.group(1)[:3].lower()], int(m.group(2)))
+        except ValueError:
+            pass
+    # Other layouts: use dateutil if a month name is present
+    if _RE_ENGLISH_MONTH.search(title):
         try:
             v = dateparser.parse(title, fuzzy=True)
             if v:
@@ -78,32 +126,126 @@ def extract_date_from_title(title: str) -> dt.date | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _date_folder(audio_dir: str, year: int, month: int) -> str:
+    # `<audio_dir>/YYYY/MM`, built once per month and shared by its episodes
+    return os.path.join(audio_dir, str(year), f"{month:02d}")
+
+
+# Called per episode URL with the same site link; strings are immutable, so
+# repeated calls share one result
+@functools.lru_cache(maxsize=1024)
 def build_public_url(site_link: str, rel_path: str) -> str:
     return site_link.rstrip("/") + "/" + rel_path.lstrip("/")
 
 
-def write_audio_with_id3(path: str, data: bytes, title: str, artist: str, date_str: str, link: str) -> None:
+def write_transcript(path: str, text: str) -> None:
+    # Encoded once and written in one call, bypassing the text-mode layer
     with open(path, "wb") as f:
-        f.write(data)
-    try:
-        tags = EasyID3(path)
-    except Exception:
-        tags = EasyID3()
-        tags.save(path)
-        tags = EasyID3(path)
-    tags["title"] = title
+        f.write(text.encode("utf-8"))
+
+
+def write_audio_with_id3(
+    path: str, data: Union[bytes, Iterable[bytes]], title: str, artist: str, date_str: str, link: str
+) -> None:
+    # Either the whole MP3 or its parts in order; parts are streamed out as-is
+    parts = [data] if isinstance(data, (bytes, bytearray)) else list(data)
+    if parts and parts[0][:3] == b"ID3":
+        # The encoder wrote its own tag: merge into it on disk, keeping its frames
+        with open(path, "wb") as f:
+            f.writelines(parts)
+        id3 = ID3(path)
+        _set_episode_tags(id3, title, artist, date_str, link)
+        id3.save(path, v2_version=3)
+        return
+    # Raw frames: render the tag in memory and write tag + audio in one pass,
+    # instead of writing the audio and having mutagen rewrite the whole file
+    # to insert the tag in front. Padding matches what that save would pick
+    id3 = ID3()
+    _set_episode_tags(id3, title, artist, date_str, link)
+    audio_len = sum(map(len, parts))
+    tag = io.BytesIO()
+    id3.save(tag, v2_version=3, padding=lambda info: PaddingInfo(info.padding, audio_len).get_default_padding())
+    with open(path, "wb") as f:
+        f.write(tag.getvalue())
+        f.writelines(parts)
+
+
+def _set_episode_tags(id3: ID3, title: str, artist: str, date_str: str, link: str) -> None:
+    id3.setall("TIT2", [TIT2(encoding=3, text=title)])
     if artist:
-        tags["artist"] = artist
+        id3.setall("TPE1", [TPE1(encoding=3, text=artist)])
     if date_str:
-        tags["date"] = date_str
-    tags.save()
+        id3.setall("TDRC", [TDRC(encoding=3, text=date_str)])
+    if link:
+        id3.add(WOAF(url=link))
+
+
+def _synthesize(config: AppConfig, text: str) -> List[bytes]:
+    # Audio comes back as the provider's per-chunk parts and is written out
+    # part by part, so an episode is never held twice in memory
+    if config.tts.provider.lower() == "openai":
+        return synthesize_mp3_openai_parts(
+            text=text,
+            model=config.tts.openai_model,
+            voice=config.tts.openai_voice,
+            max_chars_per_chunk=config.tts.max_chars_per_chunk,
+            max_retries=config.tts.max_retries,
+            initial_retry_delay=config.tts.initial_retry_delay,
+            api_key_env=(getattr(config.llm, "api_key_env", "OPENAI_API_KEY") if getattr(config, "llm", None) else "OPENAI_API_KEY"),
+            max_parallel_chunks=config.tts.max_parallel_chunks,
+        )
+    return synthesize_mp3_parts(
+        text=text,
+        language_code=config.tts.language_code,
+        voice_name=config.tts.voice_name,
+        speaking_rate=config.tts.speaking_rate,
+        pitch=config.tts.pitch,
+        volume_gain_db=config.tts.volume_gain_db,
+        max_chars_per_chunk=config.tts.max_chars_per_chunk,
+        max_retries=config.tts.max_retries,
+        initial_retry_delay=config.tts.initial_retry_delay,
+        max_parallel_chunks=config.tts.max_parallel_chunks,
+    )
+
+
+def episode_content_hash(ep: Dict[str, Any]) -> str | None:
     try:
-        id3 = ID3(path)
-        if link:
-            id3.add(WOAF(url=link))
-        id3.save(v2_version=3)
+        if ep.get("content_hash"):
+            return str(ep["content_hash"])  # type: ignore[return-value]
+        ep_id = ep.get("id")
+        if isinstance(ep_id, str) and "::" in ep_id:
+            return ep_id.split("::")[-1]
     except Exception:
         pass
+    return None
+
+
+def item_content_hash(it: Dict[str, Any]) -> str:
+    # Digest of the cleaned text (raw HTML when cleaning left nothing); new
+    # items carry it from the processed-key step
+    if it.get("clean_text"):
+        return it.get("content_hash") or sha256(it["clean_text"])
+    return sha256(it.get("content_html", "") or "")
+
+
+def _items_desc_html(items: List[Dict[str, Any]]) -> str:
+    return "".join(
+        f"<p><strong>{idx}. {it['title']}</strong><br/>{it['desc_html']}</p>" for idx, it in enumerate(items, start=1)
+    )
+
+
+def _compilation_desc_html(items_desc: str, components: List[Dict[str, Any]], tts_error: Optional[str]) -> str:
+    # Item descriptions, then the component summary with sources; one join
+    parts = [items_desc, "<h4>Included items</h4><ul>"]
+    parts.extend(
+        f"<li><a href=\"{c.get('link','')}\">{c.get('title','')}</a> — source: {c.get('source','unknown')}</li>"
+        for c in components
+    )
+    parts.append("</ul>")
+    if tts_error:
+        parts.append(f"<p><em>TTS failed: {tts_error}</em></p>")
+    return "".join(parts)
 
 
 def run(config: AppConfig) -> int:
@@ -111,29 +253,45 @@ def run(config: AppConfig) -> int:
     out_root = config.output.root_dir
     audio_dir = os.path.join(out_root, config.output.audio_dir)
     ensure_dirs(out_root, audio_dir, "data")
+    prune_page_cache()
 
     # Load state
     state = load_state()
     processed: Dict[str, Any] = state.get("processed", {})
     episodes: List[Dict[str, Any]] = state.get("episodes", [])
+    # Lookups for the unchanged-content checks below, built in one
+    # pass; the first matching episode wins, as with a scan in list order
+    ep_by_hash: Dict[str, Dict[str, Any]] = {}
+    ep_with_audio_by_hash: Dict[str, Dict[str, Any]] = {}
+    for ep in episodes:
+        h = episode_content_hash(ep)
+        if h:
+            ep_by_hash.setdefault(h, ep)
+            if ep.get("audio_url"):
+                ep_with_audio_by_hash.setdefault(h, ep)
 
     # Fetch
-    items = fetch_feed(config.feed.url, fetch_original=config.feed.fetch_original)
+    items = fetch_feed(
+        config.feed.url,
+        fetch_original=config.feed.fetch_original,
+        max_workers=config.feed.fetch_workers,
+    )
 
     # Prepare new items
+    cleaned_all = clean_html_batch(
+        [it["content_html"] for it in items],
+        remove_emoji=config.clean.remove_emoji,
+        remove_ads=config.clean.remove_ads,
+        ad_keywords=config.clean.ad_keywords,
+    )
     new_items: List[Dict[str, Any]] = []
-    for it in items:
-        cleaned, desc_html = clean_html_text(
-            it["content_html"],
-            remove_emoji=config.clean.remove_emoji,
-            remove_ads=config.clean.remove_ads,
-            ad_keywords=config.clean.ad_keywords,
-        )
-        content_hash = sha256(cleaned)
+    # One digest per distinct body; the episode branches reuse it below
+    digests = sha256_many([cleaned for cleaned, _ in cleaned_all])
+    for it, (cleaned, desc_html), content_hash in zip(items, cleaned_all, digests):
         key = f"{it['guid']}::{content_hash}"
         if key in processed:
             continue
-        enriched = {**it, "clean_text": cleaned, "desc_html": desc_html, "key": key}
+        enriched = {**it, "clean_text": cleaned, "desc_html": desc_html, "key": key, "content_hash": content_hash}
         new_items.append(enriched)
 
     # Log content source per new item and summary counts
@@ -159,6 +317,9 @@ def run(config: AppConfig) -> int:
     force_rewrite_feed = False
 
     if config.mode == "separate":
+        # Text, transcript and paths per item first; the network-bound TTS
+        # calls then run concurrently and episodes are built in feed order
+        plans: List[Dict[str, Any]] = []
         for it in new_items:
             orig_title = it["title"]
             author = it.get("author", config.site.author)
@@ -178,84 +339,75 @@ def run(config: AppConfig) -> int:
             text = maybe_clean_text_with_llm(text, config)
             text = maybe_rewrite_for_audio(text, config)
 
-            audio_rel = None
-            audio_bytes_len = 0
-            tts_error = None
-            transcript_rel = None
-
             # Plan paths (audio + transcript) upfront
-            date_folder = os.path.join(
-                config.output.audio_dir,
-                str(effective_date.year),
-                f"{effective_date.month:02d}",
-            )
+            date_folder = _date_folder(config.output.audio_dir, effective_date.year, effective_date.month)
             out_dir = os.path.join(config.output.root_dir, date_folder)
             ensure_dirs(out_dir)
-            slug = slugify(f"{effective_date}-{title}")
+            slug = slugify(f"{effective_date}-{orig_title}")
             transcript_fname = f"{slug}.txt"
             transcript_path = os.path.join(out_dir, transcript_fname)
-            with open(transcript_path, "w", encoding="utf-8") as tf:
-                tf.write(text)
-            transcript_rel = os.path.join(date_folder, transcript_fname)
+            write_transcript(transcript_path, text)
 
-            if config.tts.enabled:
-                try:
-                    if config.tts.provider.lower() == "openai":
-                        mp3 = synthesize_mp3_openai(
-                            text=text,
-                            model=config.tts.openai_model,
-                            voice=config.tts.openai_voice,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                            api_key_env=(getattr(config.llm, "api_key_env", "OPENAI_API_KEY") if getattr(config, "llm", None) else "OPENAI_API_KEY"),
-                        )
-                    else:
-                        mp3 = synthesize_mp3(
-                            text=text,
-                            language_code=config.tts.language_code,
-                            voice_name=config.tts.voice_name,
-                            speaking_rate=config.tts.speaking_rate,
-                            pitch=config.tts.pitch,
-                            volume_gain_db=config.tts.volume_gain_db,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                        )
-                    # Build audio path
-                    fname = f"{slug}.mp3"
-                    path = os.path.join(out_dir, fname)
-                    write_audio_with_id3(
-                        path,
-                        mp3,
-                        title=episode_title,
-                        artist=author or config.site.title,
-                        date_str=str(effective_date),
-                        link=link,
-                    )
-                    audio_rel = os.path.join(date_folder, fname)
-                    audio_bytes_len = len(mp3)
-                except Exception as e:  # noqa: BLE001
-                    tts_error = str(e)
-                    gha_notice("ERROR", f"TTS failed for item: {title}: {tts_error}")
+            plans.append({
+                "item": it,
+                "orig_title": orig_title,
+                "episode_title": episode_title,
+                "author": author,
+                "link": link,
+                "pub_dt": pub_dt,
+                "effective_date": effective_date,
+                "text": text,
+                "date_folder": date_folder,
+                "out_dir": out_dir,
+                "slug": slug,
+                "transcript_rel": os.path.join(date_folder, transcript_fname),
+            })
+
+        def _item_audio(p: Dict[str, Any]) -> Tuple[Optional[str], int, Optional[str]]:
+            try:
+                mp3_parts = _synthesize(config, p["text"])
+                # Build audio path
+                fname = f"{p['slug']}.mp3"
+                path = os.path.join(p["out_dir"], fname)
+                write_audio_with_id3(
+                    path,
+                    mp3_parts,
+                    title=p["episode_title"],
+                    artist=p["author"] or config.site.title,
+                    date_str=str(p["effective_date"]),
+                    link=p["link"],
+                )
+                return os.path.join(p["date_folder"], fname), sum(map(len, mp3_parts)), None
+            except Exception as e:  # noqa: BLE001
+                gha_notice("ERROR", f"TTS failed for item: {p['orig_title']}: {e}")
+                return None, 0, str(e)
+
+        audio: List[Tuple[Optional[str], int, Optional[str]]] = [(None, 0, None)] * len(plans)
+        if config.tts.enabled and plans:
+            workers = max(1, min(config.tts.max_concurrency, len(plans)))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                audio = list(ex.map(_item_audio, plans))
+
+        for p, (audio_rel, audio_bytes_len, tts_error) in zip(plans, audio):
+            it = p["item"]
+            transcript_rel = p["transcript_rel"]
 
             # Build description with source footer
             source = it.get("content_source", "unknown")
             desc_html = it["desc_html"] + f"<p><small>Source: {source}</small></p>"
 
-            canonical_text = it.get("clean_text") or it.get("content_html", "")
-            canonical_hash = sha256(canonical_text or "")
+            canonical_hash = item_content_hash(it)
 
             episode = {
                 "id": it["key"],
-                "title": episode_title,
-                "link": link,
-                "pub_date": pub_dt,
+                "title": p["episode_title"],
+                "link": p["link"],
+                "pub_date": p["pub_dt"],
                 "description_html": desc_html + (f"<p><em>TTS failed: {tts_error}</em></p>" if tts_error else ""),
                 "audio_url": build_public_url(config.site.link, audio_rel) if audio_rel else None,
                 "audio_bytes": audio_bytes_len,
                 "components": [
-                    {"title": orig_title, "link": link, "source": source},
+                    {"title": p["orig_title"], "link": p["link"], "source": source},
                 ],
                 "transcript_url": build_public_url(config.site.link, transcript_rel) if transcript_rel else None,
                 "content_hash": canonical_hash,
@@ -267,32 +419,19 @@ def run(config: AppConfig) -> int:
         # otherwise compile all available items regardless of date.
         base_pool = new_items if new_items else items
         # If we fell back to raw items (because all new items were already processed),
-        # enrich them with cleaned text so downstream logic can rely on 'clean_text'.
+        # enrich them with the cleaned text computed above so downstream logic can rely on 'clean_text'.
         if not new_items:
-            enriched_pool: List[Dict[str, Any]] = []
-            for it in base_pool:
-                try:
-                    cleaned, desc_html = clean_html_text(
-                        it["content_html"],
-                        remove_emoji=config.clean.remove_emoji,
-                        remove_ads=config.clean.remove_ads,
-                        ad_keywords=config.clean.ad_keywords,
-                    )
-                except Exception:
-                    cleaned, desc_html = it.get("content_html", ""), it.get("content_html", "")
-                enriched_pool.append({**it, "clean_text": cleaned, "desc_html": desc_html})
-            base_pool = enriched_pool
+            base_pool = [
+                {**it, "clean_text": cleaned, "desc_html": desc_html}
+                for it, (cleaned, desc_html) in zip(items, cleaned_all)
+            ]
         issue_candidates = [
             it for it in base_pool if it.get("content_source") in ("newsletter_issue", "newsletter_issue_text")
         ]
         issue_item = None
         if issue_candidates:
             # Pick the most recent by published datetime if available
-            issue_item = sorted(
-                issue_candidates,
-                key=lambda x: parse_datetime(x.get("published", "")),
-                reverse=True,
-            )[0]
+            issue_item = max(issue_candidates, key=lambda x: parse_datetime(x.get("published", "")))
 
         if issue_item is not None:
             orig_title = issue_item.get("title") or f"{config.feed.name} — Latest"
@@ -308,37 +447,17 @@ def run(config: AppConfig) -> int:
                 # Fallback: keep original pub_dt if replace fails (shouldn't happen for valid dates)
                 pass
             # Episode display title: `<feed.name>: YYYY-MM-DD`
-            episode_title = f"{config.feed.name}: {effective_date.isoformat()}"
+            date_iso = effective_date.isoformat()
+            episode_title = f"{config.feed.name}: {date_iso}"
             # Compute canonical hash BEFORE any LLM rewrite to avoid false diffs
-            canonical_text = issue_item.get('clean_text') or issue_item.get('content_html', '') or ''
-            current_hash = sha256(canonical_text)
+            current_hash = item_content_hash(issue_item)
 
-            # TTS text keeps the newsletter's own title for natural narration, then LLM steps
+            # TTS text keeps the newsletter's own title for natural narration
             text = (
                 f"{orig_title}." + (f" By {author}." if author else "") + f" {issue_item.get('clean_text', issue_item.get('content_html',''))}"
             )
-            text = maybe_clean_text_with_llm(text, config)
-            text = maybe_rewrite_for_audio(text, config)
 
-            def episode_content_hash(ep: Dict[str, Any]) -> str | None:
-                try:
-                    if ep.get("content_hash"):
-                        return str(ep["content_hash"])  # type: ignore[return-value]
-                    ep_id = ep.get("id")
-                    if isinstance(ep_id, str) and "::" in ep_id:
-                        return ep_id.split("::")[-1]
-                except Exception:
-                    pass
-                return None
-
-            duplicate_ep = None
-            for ep in episodes:
-                try:
-                    if episode_content_hash(ep) == current_hash:
-                        duplicate_ep = ep
-                        break
-                except Exception:
-                    continue
+            duplicate_ep = ep_by_hash.get(current_hash)
 
             # If content hasn't changed, avoid creating a new episode (allow re-synthesis if no audio yet)
             if duplicate_ep:
@@ -353,17 +472,6 @@ def run(config: AppConfig) -> int:
                 except Exception:
                     pass
 
-            # Gating: if an episode for this date already exists AND has audio, skip;
-            # otherwise allow re-synthesis to recover from prior TTS failure.
-            has_episode_with_audio = False
-            for ep in episodes:
-                try:
-                    ep_dt = ep.get("pub_date")
-                    if isinstance(ep_dt, dt.datetime) and ep_dt.date() == effective_date and ep.get("audio_url"):
-                        has_episode_with_audio = True
-                        break
-                except Exception:
-                    continue
             if issue_item is None:
                 # Already handled as duplicate-no-change case above
                 skip_generation = True
@@ -371,6 +479,9 @@ def run(config: AppConfig) -> int:
                 # Even if an episode exists for the same date, allow regeneration
                 # when content changed (we'll replace the older one below).
                 skip_generation = False
+                # LLM steps only once the episode is known to be generated
+                text = maybe_clean_text_with_llm(text, config)
+                text = maybe_rewrite_for_audio(text, config)
 
             audio_rel = None
             audio_bytes_len = 0
@@ -378,55 +489,30 @@ def run(config: AppConfig) -> int:
             transcript_rel = None
 
             # Pre-create transcript (even if TTS fails)
-            date_folder = os.path.join(
-                config.output.audio_dir,
-                str(effective_date.year),
-                f"{effective_date.month:02d}",
-            )
+            date_folder = _date_folder(config.output.audio_dir, effective_date.year, effective_date.month)
             out_dir = os.path.join(config.output.root_dir, date_folder)
             ensure_dirs(out_dir)
-            transcript_fname = f"{effective_date.isoformat()}.txt"
+            transcript_fname = f"{date_iso}.txt"
             transcript_path = os.path.join(out_dir, transcript_fname)
-            with open(transcript_path, "w", encoding="utf-8") as tf:
-                tf.write(text)
-            transcript_rel = os.path.join(date_folder, transcript_fname)
+            if not skip_generation:
+                write_transcript(transcript_path, text)
+                transcript_rel = os.path.join(date_folder, transcript_fname)
 
             if (not skip_generation) and config.tts.enabled:
                 try:
-                    if config.tts.provider.lower() == "openai":
-                        mp3 = synthesize_mp3_openai(
-                            text=text,
-                            model=config.tts.openai_model,
-                            voice=config.tts.openai_voice,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                            api_key_env=(getattr(config.llm, "api_key_env", "OPENAI_API_KEY") if getattr(config, "llm", None) else "OPENAI_API_KEY"),
-                        )
-                    else:
-                        mp3 = synthesize_mp3(
-                            text=text,
-                            language_code=config.tts.language_code,
-                            voice_name=config.tts.voice_name,
-                            speaking_rate=config.tts.speaking_rate,
-                            pitch=config.tts.pitch,
-                            volume_gain_db=config.tts.volume_gain_db,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                        )
-                    fname = f"{effective_date.isoformat()}.mp3"
+                    mp3_parts = _synthesize(config, text)
+                    fname = f"{date_iso}.mp3"
                     path = os.path.join(out_dir, fname)
                     write_audio_with_id3(
                         path,
-                        mp3,
+                        mp3_parts,
                         title=episode_title,
                         artist=config.site.title,
                         date_str=str(effective_date),
                         link=link,
                     )
                     audio_rel = os.path.join(date_folder, fname)
-                    audio_bytes_len = len(mp3)
+                    audio_bytes_len = sum(map(len, mp3_parts))
                 except Exception as e:  # noqa: BLE001
                     tts_error = str(e)
                     gha_notice("ERROR", f"TTS failed for forced compilation issue: {tts_error}")
@@ -437,7 +523,7 @@ def run(config: AppConfig) -> int:
                     desc_html += f"<p><em>TTS failed: {tts_error}</em></p>"
 
                 episode = {
-                    "id": f"issue::{effective_date.isoformat()}::{current_hash}",
+                    "id": f"issue::{date_iso}::{current_hash}",
                     "title": episode_title,
                     "link": link,
                     "pub_date": pub_dt,
@@ -467,7 +553,6 @@ def run(config: AppConfig) -> int:
             parts = []
             links = []
             components = []
-            latest_dt = None
             for idx, it in enumerate(base_pool, start=1):
                 author = it.get("author") or config.site.author
                 parts.append(f"Item {idx}: {it['title']}." + (f" By {author}." if author else ""))
@@ -478,22 +563,14 @@ def run(config: AppConfig) -> int:
                     "link": it.get("link"),
                     "source": it.get("content_source", "unknown"),
                 })
-                dtv = parse_datetime(it.get("published", ""))
-                latest_dt = max(latest_dt, dtv) if latest_dt else dtv
             text = "\n\n".join(parts)
-            # Canonical hash (pre-LLM) for today's compilation
-            try:
-                canonical_concat = "\n\n".join([it.get("clean_text", "") for it in todays])
-            except Exception:
-                canonical_concat = text
-            today_hash = sha256(canonical_concat)
-            text = maybe_clean_text_with_llm(text, config)
-            text = maybe_rewrite_for_audio(text, config)
+            latest_dt = max((parse_datetime(it.get("published", "")) for it in base_pool), default=None)
 
             # Episode display title for compilation fallback: `<feed.name>: YYYY-MM-DD`
             link = links[0] if links else config.site.link
             pub_dt = latest_dt or dt.datetime.now(dt.timezone.utc)
-            episode_title = f"{config.feed.name}: {pub_dt.date().isoformat()}"
+            date_iso = pub_dt.date().isoformat()
+            episode_title = f"{config.feed.name}: {date_iso}"
 
             # Canonical hash from cleaned text only (pre-LLM rewrite)
             try:
@@ -502,31 +579,23 @@ def run(config: AppConfig) -> int:
                 canonical_concat = text
             comp_hash = sha256(canonical_concat)
 
+            # Numbered item descriptions: refreshes an unchanged episode or starts a new one
+            items_desc = _items_desc_html(base_pool)
+
             # If identical content already exists with audio, skip generation
             do_generate = True
-            for ep in episodes:
-                try:
-                    h = ep.get("content_hash")
-                    if not h:
-                        ep_id = ep.get("id")
-                        if isinstance(ep_id, str) and "::" in ep_id:
-                            h = ep_id.split("::")[-1]
-                    if h == comp_hash and ep.get("audio_url"):
-                        logger.info("Compilation (forced) unchanged; skipping generation and refreshing feed/index")
-                        do_generate = False
-                        force_rewrite_feed = True
-                        # Refresh description of existing episode
-                        try:
-                            new_desc = "".join(
-                                f"<p><strong>{idx}. {it['title']}</strong><br/>{it['desc_html']}</p>" for idx, it in enumerate(base_pool, start=1)
-                            )
-                            if new_desc:
-                                ep["description_html"] = new_desc
-                        except Exception:
-                            pass
-                        break
-                except Exception:
-                    continue
+            ep = ep_with_audio_by_hash.get(comp_hash)
+            if ep is not None:
+                logger.info("Compilation (forced) unchanged; skipping generation and refreshing feed/index")
+                do_generate = False
+                force_rewrite_feed = True
+                # Refresh description of existing episode
+                if items_desc:
+                    ep["description_html"] = items_desc
+            else:
+                # LLM steps only once the compilation is known to be generated
+                text = maybe_clean_text_with_llm(text, config)
+                text = maybe_rewrite_for_audio(text, config)
 
             audio_rel = None
             audio_bytes_len = 0
@@ -534,74 +603,39 @@ def run(config: AppConfig) -> int:
             transcript_rel = None
 
             # Pre-create transcript (even if TTS fails)
-            date_folder = os.path.join(
-                config.output.audio_dir,
-                str(pub_dt.year),
-                f"{pub_dt.month:02d}",
-            )
+            date_folder = _date_folder(config.output.audio_dir, pub_dt.year, pub_dt.month)
             out_dir = os.path.join(config.output.root_dir, date_folder)
             ensure_dirs(out_dir)
-            transcript_fname = f"{pub_dt.date().isoformat()}.txt"
+            transcript_fname = f"{date_iso}.txt"
             transcript_path = os.path.join(out_dir, transcript_fname)
             if do_generate:
-                with open(transcript_path, "w", encoding="utf-8") as tf:
-                    tf.write(text)
+                write_transcript(transcript_path, text)
                 transcript_rel = os.path.join(date_folder, transcript_fname)
 
             if config.tts.enabled and do_generate:
                 try:
-                    if config.tts.provider.lower() == "openai":
-                        mp3 = synthesize_mp3_openai(
-                            text=text,
-                            model=config.tts.openai_model,
-                            voice=config.tts.openai_voice,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                            api_key_env=(getattr(config.llm, "api_key_env", "OPENAI_API_KEY") if getattr(config, "llm", None) else "OPENAI_API_KEY"),
-                        )
-                    else:
-                        mp3 = synthesize_mp3(
-                            text=text,
-                            language_code=config.tts.language_code,
-                            voice_name=config.tts.voice_name,
-                            speaking_rate=config.tts.speaking_rate,
-                            pitch=config.tts.pitch,
-                            volume_gain_db=config.tts.volume_gain_db,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                        )
-                    fname = f"{pub_dt.date().isoformat()}.mp3"
+                    mp3_parts = _synthesize(config, text)
+                    fname = f"{date_iso}.mp3"
                     path = os.path.join(out_dir, fname)
                     write_audio_with_id3(
                         path,
-                        mp3,
+                        mp3_parts,
                         title=episode_title,
                         artist=config.site.title,
                         date_str=str(pub_dt.date()),
                         link=link,
                     )
                     audio_rel = os.path.join(date_folder, fname)
-                    audio_bytes_len = len(mp3)
+                    audio_bytes_len = sum(map(len, mp3_parts))
                 except Exception as e:  # noqa: BLE001
                     tts_error = str(e)
                     gha_notice("ERROR", f"TTS failed for forced compilation: {tts_error}")
 
             if do_generate:
-                desc_html = "".join(
-                    f"<p><strong>{idx}. {it['title']}</strong><br/>{it['desc_html']}</p>" for idx, it in enumerate(base_pool, start=1)
-                )
-                comp_list = "".join(
-                    f"<li><a href=\"{c.get('link','')}\">{c.get('title','')}</a> — source: {c.get('source','unknown')}</li>"
-                    for c in components
-                )
-                desc_html += f"<h4>Included items</h4><ul>{comp_list}</ul>"
-                if tts_error:
-                    desc_html += f"<p><em>TTS failed: {tts_error}</em></p>"
+                desc_html = _compilation_desc_html(items_desc, components, tts_error)
 
                 episode = {
-                    "id": f"forced::{pub_dt.date().isoformat()}::{comp_hash}",
+                    "id": f"forced::{date_iso}::{comp_hash}",
                     "title": episode_title,
                     "link": link,
                     "pub_date": pub_dt,
@@ -635,35 +669,27 @@ def run(config: AppConfig) -> int:
             text = "\n\n".join(parts)
 
             # Episode display title for standard compilation: `<feed.name>: YYYY-MM-DD`
-            episode_title = f"{config.feed.name}: {today.isoformat()}"
+            date_iso = today.isoformat()
+            episode_title = f"{config.feed.name}: {date_iso}"
             link = links[0] if links else config.site.link
             pub_dt = dt.datetime.combine(today, dt.time(9, 0, tzinfo=dt.timezone.utc))
 
+            # Canonical hash from cleaned text only
+            today_hash = sha256("\n\n".join(it.get("clean_text", "") for it in todays))
+
+            # Numbered item descriptions: refreshes an unchanged episode or starts a new one
+            items_desc = _items_desc_html(todays)
+
             # If identical content already exists with audio, skip generation
             do_generate = True
-            for ep in episodes:
-                try:
-                    h = ep.get("content_hash")
-                    if not h:
-                        ep_id = ep.get("id")
-                        if isinstance(ep_id, str) and "::" in ep_id:
-                            h = ep_id.split("::")[-1]
-                    if h == today_hash and ep.get("audio_url"):
-                        logger.info("Today's compilation unchanged; skipping generation and refreshing feed/index")
-                        do_generate = False
-                        force_rewrite_feed = True
-                        # Refresh description
-                        try:
-                            new_desc = "".join(
-                                f"<p><strong>{idx}. {it['title']}</strong><br/>{it['desc_html']}</p>" for idx, it in enumerate(todays, start=1)
-                            )
-                            if new_desc:
-                                ep["description_html"] = new_desc
-                        except Exception:
-                            pass
-                        break
-                except Exception:
-                    continue
+            ep = ep_with_audio_by_hash.get(today_hash)
+            if ep is not None:
+                logger.info("Today's compilation unchanged; skipping generation and refreshing feed/index")
+                do_generate = False
+                force_rewrite_feed = True
+                # Refresh description
+                if items_desc:
+                    ep["description_html"] = items_desc
 
             audio_rel = None
             audio_bytes_len = 0
@@ -671,75 +697,39 @@ def run(config: AppConfig) -> int:
             transcript_rel = None
 
             # Pre-create transcript (even if TTS fails)
-            date_folder = os.path.join(
-                config.output.audio_dir,
-                str(pub_dt.year),
-                f"{pub_dt.month:02d}",
-            )
+            date_folder = _date_folder(config.output.audio_dir, pub_dt.year, pub_dt.month)
             out_dir = os.path.join(config.output.root_dir, date_folder)
             ensure_dirs(out_dir)
-            transcript_fname = f"{today.isoformat()}.txt"
+            transcript_fname = f"{date_iso}.txt"
             transcript_path = os.path.join(out_dir, transcript_fname)
             if do_generate:
-                with open(transcript_path, "w", encoding="utf-8") as tf:
-                    tf.write(text)
+                write_transcript(transcript_path, text)
                 transcript_rel = os.path.join(date_folder, transcript_fname)
 
             if config.tts.enabled and do_generate:
                 try:
-                    if config.tts.provider.lower() == "openai":
-                        mp3 = synthesize_mp3_openai(
-                            text=text,
-                            model=config.tts.openai_model,
-                            voice=config.tts.openai_voice,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                            api_key_env=(getattr(config.llm, "api_key_env", "OPENAI_API_KEY") if getattr(config, "llm", None) else "OPENAI_API_KEY"),
-                        )
-                    else:
-                        mp3 = synthesize_mp3(
-                            text=text,
-                            language_code=config.tts.language_code,
-                            voice_name=config.tts.voice_name,
-                            speaking_rate=config.tts.speaking_rate,
-                            pitch=config.tts.pitch,
-                            volume_gain_db=config.tts.volume_gain_db,
-                            max_chars_per_chunk=config.tts.max_chars_per_chunk,
-                            max_retries=config.tts.max_retries,
-                            initial_retry_delay=config.tts.initial_retry_delay,
-                        )
-                    fname = f"{today.isoformat()}.mp3"
+                    mp3_parts = _synthesize(config, text)
+                    fname = f"{date_iso}.mp3"
                     path = os.path.join(out_dir, fname)
                     write_audio_with_id3(
                         path,
-                        mp3,
+                        mp3_parts,
                         title=episode_title,
                         artist=config.site.title,
                         date_str=str(pub_dt.date()),
                         link=link,
                     )
                     audio_rel = os.path.join(date_folder, fname)
-                    audio_bytes_len = len(mp3)
+                    audio_bytes_len = sum(map(len, mp3_parts))
                 except Exception as e:  # noqa: BLE001
                     tts_error = str(e)
                     gha_notice("ERROR", f"TTS failed for compiled episode: {tts_error}")
 
             if do_generate:
-                desc_html = "".join(
-                    f"<p><strong>{idx}. {it['title']}</strong><br/>{it['desc_html']}</p>" for idx, it in enumerate(todays, start=1)
-                )
-                # Append component summary with sources
-                comp_list = "".join(
-                    f"<li><a href=\"{c.get('link','')}\">{c.get('title','')}</a> — source: {c.get('source','unknown')}</li>"
-                    for c in components
-                )
-                desc_html += f"<h4>Included items</h4><ul>{comp_list}</ul>"
-                if tts_error:
-                    desc_html += f"<p><em>TTS failed: {tts_error}</em></p>"
+                desc_html = _compilation_desc_html(items_desc, components, tts_error)
 
                 episode = {
-                    "id": f"compilation::{today.isoformat()}::{today_hash}",
+                    "id": f"compilation::{date_iso}::{today_hash}",
                     "title": episode_title,
                     "link": link,
                     "pub_date": pub_dt,
@@ -785,12 +775,12 @@ def run(config: AppConfig) -> int:
         items=episodes,
         feed_url=feed_url,
     )
-    with open(feed_path, "w", encoding="utf-8") as f:
-        f.write(xml)
+    # Unchanged outputs are left untouched, so Pages does not redeploy them
+    if not write_if_changed(feed_path, xml.encode("utf-8")):
+        logger.info("Feed unchanged; not rewriting", extra={"path": feed_path})
 
     index_path = os.path.join(config.output.root_dir, config.output.index_filename)
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(render_index_html(config.site.title, feed_url))
+    write_if_changed(index_path, render_index_html(config.site.title, feed_url).encode("utf-8"))
 
     # Save state
     save_state(state)
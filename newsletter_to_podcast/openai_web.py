@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Web-search responses can take a while; bound a single fetch so a stuck
+# request gives up instead of hanging
+WEB_TIMEOUT_S = 60.0
 
+
+# One client per key for the process: its connection pool is shared, so
+# repeated fetches reuse open connections instead of new TLS handshakes
+@functools.lru_cache(maxsize=4)
 def _get_openai_client(api_key: Optional[str]):
     try:
         from openai import OpenAI  # type: ignore
@@ -15,7 +23,7 @@ def _get_openai_client(api_key: Optional[str]):
     if not api_key:
         return None, None
     try:
-        client = OpenAI(api_key=api_key)
+        client = OpenAI(api_key=api_key, timeout=WEB_TIMEOUT_S)
         return client, OpenAI
     except Exception:
         return None, None
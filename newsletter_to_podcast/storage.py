@@ -3,24 +3,44 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import re
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from dateutil import parser as dateparser
 
+try:
+    import orjson  # optional: parses and serializes state several times faster than json
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 STATE_PATH = os.path.join("data", "state.json")
 
 
+# Directories already made by this process; runs create the same few month
+# folders over and over. Keyed by absolute path so a chdir cannot fool it
+_CREATED_DIRS: set[str] = set()
+
+
 def ensure_dirs(*paths: str) -> None:
     for p in paths:
+        key = os.path.abspath(p)
+        if key in _CREATED_DIRS:
+            continue
         os.makedirs(p, exist_ok=True)
+        _CREATED_DIRS.add(key)
+
+
+# Runs of anything but Unicode letters/digits (str.isalnum), including "_"
+_NON_ALNUM_PAT = re.compile(r"[\W_]+")
 
 
 def slugify(text: str) -> str:
-    safe = "".join(ch.lower() if ch.isalnum() else "-" for ch in text)
-    while "--" in safe:
-        safe = safe.replace("--", "-")
+    safe = _NON_ALNUM_PAT.sub("-", text)
+    # Lowered as a whole, except capital sigma: str.lower() would turn a
+    # word-final one into "ς" where per-character lowering gives "σ"
+    safe = safe.replace("Σ", "σ").lower()
     return safe.strip("-")[:120] or "episode"
 
 
@@ -28,19 +48,31 @@ def sha256(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def sha256_many(texts: List[str]) -> List[str]:
+    # Digests in input order; each distinct text is hashed once
+    digests: Dict[str, str] = {}
+    for t in texts:
+        if t not in digests:
+            digests[t] = hashlib.sha256(t.encode("utf-8")).hexdigest()
+    return [digests[t] for t in texts]
+
+
 def load_state() -> Dict[str, Any]:
-    if not os.path.exists(STATE_PATH):
+    # Open directly rather than stat first; a missing file is the first run
+    try:
+        with open(STATE_PATH, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         ensure_dirs(os.path.dirname(STATE_PATH))
         return {"processed": {}, "episodes": []}
-    with open(STATE_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     # Normalize episode pub_date back to datetime objects
     episodes = data.get("episodes", []) or []
     for ep in episodes:
         pd = ep.get("pub_date")
         if isinstance(pd, str):
             try:
-                dtv = dateparser.parse(pd)
+                dtv = _parse_iso(pd)
                 if dtv is not None and dtv.tzinfo is None:
                     dtv = dtv.replace(tzinfo=timezone.utc)
                 ep["pub_date"] = dtv or datetime.now(timezone.utc)
@@ -52,13 +84,65 @@ def load_state() -> Dict[str, Any]:
     return data
 
 
+def _parse_iso(s: str) -> Optional[datetime]:
+    # State dates are written by isoformat(), so the C parser handles them;
+    # dateutil stays as the fallback for anything hand-edited
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return dateparser.parse(s)
+
+
 def _default(o: Any):
     if isinstance(o, datetime):
         return o.isoformat()
     raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
 
+def write_atomic(path: str, data: bytes) -> None:
+    # One write to a temp file, then os.replace: a crash mid-write leaves the
+    # previous file intact instead of a truncated one
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write atomically unless the file already holds exactly these bytes.
+
+    Returns True if the file was written. An untouched file keeps its mtime,
+    so reruns that change nothing leave the published site alone.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    write_atomic(path, data)
+    return True
+
+
 def save_state(state: Dict[str, Any]) -> None:
     ensure_dirs(os.path.dirname(STATE_PATH))
-    with open(STATE_PATH, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2, default=_default)
+    write_if_changed(STATE_PATH, _dumps_state(state))
+
+
+def _dumps_state(state: Dict[str, Any]) -> bytes:
+    # Indented: state.json is committed and reviewed as a diff. orjson writes
+    # the same bytes as json.dumps here, datetimes included; values it cannot
+    # encode (ints beyond 64 bits, non-str keys) fall back to json
+    if orjson is not None:
+        try:
+            return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(state, ensure_ascii=False, indent=2, default=_default).encode("utf-8")
@@ -4,8 +4,10 @@ import base64
 import json
 import logging
 import os
+import re
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, Tuple
 
 # Import Google TTS lazily inside the function to avoid requiring
 # google-cloud-texttospeech when provider is not 'gcp'.
@@ -25,35 +27,51 @@ def _ensure_credentials_from_inline_json() -> None:
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = path
 
 
+# A sentence runs up to and including its terminator; trailing text without
+# one is the last sentence
+_SENTENCE_PAT = re.compile(r"[^.!?。！？\n]*[.!?。！？\n]|[^.!?。！？\n]+\Z")
+
+
 def split_into_chunks(text: str, max_len: int) -> List[str]:
     # Simple sentence-aware chunking
-    sentences = []
-    start = 0
-    for i, ch in enumerate(text):
-        if ch in ".!?。！？\n":
-            sentences.append(text[start : i + 1].strip())
-            start = i + 1
-    if start < len(text):
-        sentences.append(text[start:].strip())
-
     chunks: List[str] = []
-    buf = ""
-    for s in sentences:
+    buf: List[str] = []
+    buf_len = 0
+    for m in _SENTENCE_PAT.finditer(text):
+        s = m.group().strip()
         if not s:
             continue
-        if len(buf) + 1 + len(s) <= max_len:
-            buf = (buf + " " + s).strip()
+        if buf_len + 1 + len(s) <= max_len:
+            buf.append(s)
+            buf_len += len(s) + (1 if buf_len else 0)
         else:
             if buf:
-                chunks.append(buf)
-            buf = s
+                chunks.append(" ".join(buf))
+            buf = [s]
+            buf_len = len(s)
     if buf:
-        chunks.append(buf)
+        chunks.append(" ".join(buf))
     if not chunks:
         chunks = [text[:max_len]]
     return chunks
 
 
+def map_chunks(fn: Callable[[Tuple[int, str]], bytes], chunks: Sequence[str], max_workers: int) -> List[bytes]:
+    """Synthesize chunks on up to max_workers threads; results keep chunk order.
+
+    Chunks are independent network-bound requests. The first failure is
+    raised once earlier chunks are in, and chunks not yet started are dropped.
+    """
+    workers = max(1, min(max_workers, len(chunks)))
+    if workers == 1:
+        return [fn(item) for item in enumerate(chunks)]
+    ex = ThreadPoolExecutor(max_workers=workers)
+    try:
+        return list(ex.map(fn, enumerate(chunks)))
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+
+
 def synthesize_mp3(
     text: str,
     language_code: str,
@@ -64,7 +82,38 @@ def synthesize_mp3(
     max_chars_per_chunk: int,
     max_retries: int,
     initial_retry_delay: float,
+    max_parallel_chunks: int = 4,
 ) -> bytes:
+    # Concatenate MP3 frames (Google returns raw frames without ID3 tags)
+    return b"".join(
+        synthesize_mp3_parts(
+            text,
+            language_code,
+            voice_name,
+            speaking_rate,
+            pitch,
+            volume_gain_db,
+            max_chars_per_chunk,
+            max_retries,
+            initial_retry_delay,
+            max_parallel_chunks,
+        )
+    )
+
+
+def synthesize_mp3_parts(
+    text: str,
+    language_code: str,
+    voice_name: str,
+    speaking_rate: float,
+    pitch: float,
+    volume_gain_db: float,
+    max_chars_per_chunk: int,
+    max_retries: int,
+    initial_retry_delay: float,
+    max_parallel_chunks: int = 4,
+) -> List[bytes]:
+    """Per-chunk MP3 frames in order; callers can write them out without joining."""
     # Lazy import to prevent hard dependency when not used
     try:
         from google.cloud import texttospeech  # type: ignore
@@ -78,34 +127,32 @@ def synthesize_mp3(
 
     chunks = split_into_chunks(text, max_chars_per_chunk)
     logger.info("Synthesizing chunks", extra={"chunks": len(chunks)})
-    audio_parts: List[bytes] = []
+    voice_params = texttospeech.VoiceSelectionParams(
+        language_code=language_code,
+        name=voice_name,
+    )
+    audio_config = texttospeech.AudioConfig(
+        audio_encoding=texttospeech.AudioEncoding.MP3,
+        speaking_rate=speaking_rate,
+        pitch=pitch,
+        volume_gain_db=volume_gain_db,
+    )
 
-    for idx, chunk in enumerate(chunks):
+    def _synth_one(item: Tuple[int, str]) -> bytes:
+        idx, chunk = item
         attempt = 0
         delay = initial_retry_delay
         while True:
             attempt += 1
             try:
-                input_text = texttospeech.SynthesisInput(text=chunk)
-                voice_params = texttospeech.VoiceSelectionParams(
-                    language_code=language_code,
-                    name=voice_name,
-                )
-                audio_config = texttospeech.AudioConfig(
-                    audio_encoding=texttospeech.AudioEncoding.MP3,
-                    speaking_rate=speaking_rate,
-                    pitch=pitch,
-                    volume_gain_db=volume_gain_db,
-                )
                 response = client.synthesize_speech(
                     request={
-                        "input": input_text,
+                        "input": texttospeech.SynthesisInput(text=chunk),
                         "voice": voice_params,
                         "audio_config": audio_config,
                     }
                 )
-                audio_parts.append(response.audio_content)
-                break
+                return response.audio_content
             except Exception as e:  # noqa: BLE001
                 logger.warning(
                     "TTS chunk failed",
@@ -116,6 +163,5 @@ def synthesize_mp3(
                 time.sleep(delay)
                 delay *= 2
 
-    # Concatenate MP3 frames (Google returns raw frames without ID3 tags)
-    mp3_bytes = b"".join(audio_parts)
-    return mp3_bytes
+    # The client is thread-safe and shared by all workers
+    return map_chunks(_synth_one, chunks, max_parallel_chunks)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-import time
 from typing import List
 
 from .tts import split_into_chunks
@@ -12,14 +12,14 @@ logger = logging.getLogger(__name__)
 
 def _get_openai_client(api_key: str | None):
     try:
-        from openai import OpenAI  # type: ignore
+        from openai import AsyncOpenAI  # type: ignore
     except Exception:
         return None, None
     if not api_key:
         return None, None
     try:
-        client = OpenAI(api_key=api_key)
-        return client, OpenAI
+        client = AsyncOpenAI(api_key=api_key)
+        return client, AsyncOpenAI
     except Exception:
         return None, None
 
@@ -32,7 +32,26 @@ def synthesize_mp3_openai(
     max_retries: int,
     initial_retry_delay: float,
     api_key_env: str = "OPENAI_API_KEY",
+    max_parallel_chunks: int = 4,
 ) -> bytes:
+    return b"".join(
+        synthesize_mp3_openai_parts(
+            text, model, voice, max_chars_per_chunk, max_retries, initial_retry_delay, api_key_env, max_parallel_chunks
+        )
+    )
+
+
+def synthesize_mp3_openai_parts(
+    text: str,
+    model: str,
+    voice: str,
+    max_chars_per_chunk: int,
+    max_retries: int,
+    initial_retry_delay: float,
+    api_key_env: str = "OPENAI_API_KEY",
+    max_parallel_chunks: int = 4,
+) -> List[bytes]:
+    """Per-chunk MP3 audio in order; callers can write it out without joining."""
     api_key = os.environ.get(api_key_env)
     client, _ = _get_openai_client(api_key)
     if client is None:
@@ -40,33 +59,72 @@ def synthesize_mp3_openai(
 
     chunks = split_into_chunks(text, max_chars_per_chunk)
     logger.info("Synthesizing (OpenAI) chunks", extra={"chunks": len(chunks)})
-    audio_parts: List[bytes] = []
-
-    for idx, chunk in enumerate(chunks):
-        attempt = 0
-        delay = initial_retry_delay
-        while True:
-            attempt += 1
-            try:
-                # Prefer streaming to reliably obtain raw bytes across SDK versions
-                with client.audio.speech.with_streaming_response.create(  # type: ignore[attr-defined]
-                    model=model,
-                    voice=voice,
-                    input=chunk,
-                ) as response:
-                    buf = b"".join(response.iter_bytes())
-                if not buf:
-                    raise RuntimeError("Empty audio buffer from OpenAI TTS")
-                audio_parts.append(buf)
-                break
-            except Exception as e:  # noqa: BLE001
-                logger.warning(
-                    "OpenAI TTS chunk failed",
-                    extra={"chunk_index": idx, "attempt": attempt, "error": str(e)},
-                )
-                if attempt >= max_retries:
-                    raise
-                time.sleep(delay)
-                delay *= 2
-
-    return b"".join(audio_parts)
+    return asyncio.run(
+        _synthesize_chunks(client, chunks, model, voice, max_retries, initial_retry_delay, max_parallel_chunks)
+    )
+
+
+async def _synthesize_chunks(
+    client,
+    chunks: List[str],
+    model: str,
+    voice: str,
+    max_retries: int,
+    initial_retry_delay: float,
+    max_parallel_chunks: int,
+) -> List[bytes]:
+    # Chunks are independent requests: keep up to max_parallel_chunks in
+    # flight on one client; gather returns the audio in chunk order
+    sem = asyncio.Semaphore(max(1, max_parallel_chunks))
+
+    async def _one(idx: int, chunk: str) -> bytes:
+        async with sem:
+            attempt = 0
+            delay = initial_retry_delay
+            while True:
+                attempt += 1
+                try:
+                    # Prefer streaming to reliably obtain raw bytes across SDK versions
+                    async with client.audio.speech.with_streaming_response.create(  # type: ignore[attr-defined]
+                        model=model,
+                        voice=voice,
+                        input=chunk,
+                    ) as response:
+                        buf = await _read_body(response)
+                    if not buf:
+                        raise RuntimeError("Empty audio buffer from OpenAI TTS")
+                    return buf
+                except Exception as e:  # noqa: BLE001
+                    logger.warning(
+                        "OpenAI TTS chunk failed",
+                        extra={"chunk_index": idx, "attempt": attempt, "error": str(e)},
+                    )
+                    if attempt >= max_retries:
+                        raise
+                    await asyncio.sleep(delay)
+                    delay *= 2
+
+    try:
+        # The first failure propagates; asyncio.run cancels the chunks still pending
+        return list(await asyncio.gather(*(_one(i, c) for i, c in enumerate(chunks))))
+    finally:
+        # The client's connection pool belongs to this event loop
+        await client.close()
+
+
+async def _read_body(response) -> bytearray:
+    # Stream into one buffer sized from Content-Length instead of collecting
+    # the pieces and joining them; a missing or wrong length only costs a
+    # resize, and the buffer is trimmed to what actually arrived
+    try:
+        size = int(response.headers.get("content-length") or 0)
+    except (AttributeError, ValueError):
+        size = 0
+    buf = bytearray(size)
+    pos = 0
+    async for part in response.iter_bytes():
+        end = pos + len(part)
+        buf[pos:end] = part
+        pos = end
+    del buf[pos:]
+    return buf